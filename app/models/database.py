@@ -1,15 +1,44 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Index, text, inspect, delete, select, func
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 from passlib.context import CryptContext
+import logging
 import uuid
 
+logger = logging.getLogger(__name__)
+
 DATABASE_URL = "sqlite:///./hrms_attendance.db"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# 커넥션 풀 설정 (동시 요청이 많아도 연결 대기가 생기지 않도록 기본값 5개보다 크게)
+POOL_OPTIONS = {
+    "pool_size": 20,
+    "max_overflow": 40,
+    "pool_pre_ping": True,  # 끊어진 연결 자동 감지
+    "pool_recycle": 1800,  # 30분마다 연결 재생성
+    "pool_timeout": 5,  # 풀이 가득 찼을 때 무한정 기다리지 않고 5초 후 실패
+}
+# 컴파일된 SQL 캐시 크기 (기본 500, 구문 종류가 많아도 재컴파일되지 않도록)
+QUERY_CACHE_SIZE = 1200
+
+engine = create_engine(
+    DATABASE_URL, connect_args={"check_same_thread": False}, query_cache_size=QUERY_CACHE_SIZE, **POOL_OPTIONS
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# 비동기 엔드포인트용 엔진 (같은 DB에 비동기 드라이버로 연결)
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+_database_url = make_url(DATABASE_URL)
+ASYNC_DATABASE_URL = _database_url.set(
+    drivername=ASYNC_DRIVERS.get(_database_url.get_backend_name(), _database_url.drivername)
+)
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, query_cache_size=QUERY_CACHE_SIZE, **POOL_OPTIONS)
+# 커밋 후 속성 만료 시 지연 로딩이 일어나지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 # 암호화 설정
@@ -60,6 +89,11 @@ class Department(Base):
     # 관계
     company = relationship("Company", back_populates="departments")
     employees = relationship("Employee", back_populates="department")
+    
+    __table_args__ = (
+        # 부서명 중복은 DB에서 거부 (생성 전 중복 조회 불필요)
+        Index("uq_department_name", "name", unique=True),
+    )
 
 class Employee(Base):
     """직원 프로필"""
@@ -87,8 +121,9 @@ class Employee(Base):
     # 관계
     user = relationship("User", back_populates="employee_profile")
     department = relationship("Department", back_populates="employees")
-    attendance_records = relationship("AttendanceRecord", back_populates="employee")
-    location_events = relationship("LocationEvent", back_populates="employee")
+    # 자식 행은 ON DELETE CASCADE로 DB에서 삭제 (직원 삭제 시 컬렉션을 로드하지 않음)
+    attendance_records = relationship("AttendanceRecord", back_populates="employee", passive_deletes=True)
+    location_events = relationship("LocationEvent", back_populates="employee", passive_deletes=True)
 
 class Site(Base):
     """근무지/사업장"""
@@ -121,7 +156,7 @@ class AttendanceRecord(Base):
     __tablename__ = "attendance_records"
     
     id = Column(Integer, primary_key=True, index=True)
-    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
+    employee_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), nullable=False)
     site_id = Column(Integer, ForeignKey("sites.id"), nullable=False)
     
     # 출근 정보
@@ -154,13 +189,38 @@ class AttendanceRecord(Base):
     employee = relationship("Employee", back_populates="attendance_records")
     site = relationship("Site", back_populates="attendance_records")
     violations = relationship("Violation", back_populates="attendance_record")
+    
+    __table_args__ = (
+        # 짧은 근무시간(4시간 미만) 위반 감지용 부분 인덱스
+        Index(
+            "ix_attendance_short_shift", "check_in_time",
+            sqlite_where=text("check_out_time IS NOT NULL AND total_work_minutes < 240"),
+            postgresql_where=text("check_out_time IS NOT NULL AND total_work_minutes < 240"),
+        ),
+        # 직원별 출근 기록 최신순 조회용
+        Index("ix_attendance_emp_checkin", employee_id, check_in_time.desc()),
+        # 날짜 범위 조회용 (대시보드 통계, 출근 기록 목록)
+        Index("ix_attendance_checkin", check_in_time),
+        # 현재 근무 중(퇴근 전)인 기록 조회용 부분 인덱스
+        Index(
+            "ix_attendance_open_checkin", check_in_time,
+            sqlite_where=text("check_out_time IS NULL"),
+            postgresql_where=text("check_out_time IS NULL"),
+        ),
+        # 직원별 퇴근 전 기록 조회용 부분 인덱스 (퇴근 체크, 현재 상태 조회)
+        Index(
+            "ix_attendance_emp_open", employee_id, check_in_time,
+            sqlite_where=text("check_out_time IS NULL"),
+            postgresql_where=text("check_out_time IS NULL"),
+        ),
+    )
 
 class LocationEvent(Base):
     """위치 이벤트 (GPS 추적)"""
     __tablename__ = "location_events"
     
     id = Column(Integer, primary_key=True, index=True)
-    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
+    employee_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), nullable=False)
     site_id = Column(Integer, ForeignKey("sites.id"), nullable=True)
     
     # 위치 정보
@@ -182,13 +242,18 @@ class LocationEvent(Base):
     # 관계
     employee = relationship("Employee", back_populates="location_events")
     site = relationship("Site", back_populates="location_events")
+    
+    __table_args__ = (
+        # 직원별 최근 위치 조회용
+        Index("ix_location_emp_ts", employee_id, timestamp.desc()),
+    )
 
 class Violation(Base):
     """규정 위반 기록"""
     __tablename__ = "violations"
     
     id = Column(Integer, primary_key=True, index=True)
-    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
+    employee_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), nullable=False)
     attendance_record_id = Column(Integer, ForeignKey("attendance_records.id"), nullable=True)
     
     # 위반 정보
@@ -214,6 +279,13 @@ class Violation(Base):
     
     # 관계
     attendance_record = relationship("AttendanceRecord", back_populates="violations")
+    
+    __table_args__ = (
+        # 자동 감지 재실행 시 같은 위반이 중복 저장되지 않도록 보장
+        Index("uq_violation_employee_type_occurred", "employee_id", "violation_type", "occurred_at", unique=True),
+        # 최근 위반 사항 목록 조회용
+        Index("ix_violation_occurred_at", occurred_at.desc()),
+    )
 
 class JobPost(Base):
     """채용 공고/일자리 게시글"""
@@ -250,14 +322,14 @@ class JobPost(Base):
     manually_closed = Column(Boolean, default=False)  # 운영자가 수동으로 마감한 경우
     
     # 관계
-    applications = relationship("JobApplication", back_populates="job_post")
+    applications = relationship("JobApplication", back_populates="job_post", passive_deletes=True)
 
 class JobApplication(Base):
     """일자리 신청"""
     __tablename__ = "job_applications"
     
     id = Column(Integer, primary_key=True, index=True)
-    job_post_id = Column(Integer, ForeignKey("job_posts.id"), nullable=False)
+    job_post_id = Column(Integer, ForeignKey("job_posts.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # 신청 정보
@@ -285,14 +357,23 @@ class JobApplication(Base):
     job_post = relationship("JobPost", back_populates="applications")
     user = relationship("User", foreign_keys=[user_id])
     reviewer = relationship("User", foreign_keys=[reviewed_by])
-    payment_logs = relationship("PaymentLog", back_populates="application")
+    payment_logs = relationship("PaymentLog", back_populates="application", passive_deletes=True)
+    
+    __table_args__ = (
+        # 사용자별 신청 조회용 (내 신청 목록, 본인 신청 확인)
+        Index("ix_jobapp_user_id", "user_id", "id"),
+        # 공고별 신청 조회용 (신청자 목록, 중복 신청 확인, 공고 삭제)
+        Index("ix_jobapp_post_user", "job_post_id", "user_id"),
+        # 결제 주문키는 신청마다 하나 (결제 승인 콜백에서 조회)
+        Index("uq_jobapp_payment_id", "payment_id", unique=True),
+    )
 
 class PaymentLog(Base):
     """결제 로그"""
     __tablename__ = "payment_logs"
     
     id = Column(Integer, primary_key=True, index=True)
-    application_id = Column(Integer, ForeignKey("job_applications.id"), nullable=False)
+    application_id = Column(Integer, ForeignKey("job_applications.id", ondelete="CASCADE"), nullable=False)
     
     # 결제 정보
     payment_type = Column(String(20), nullable=False)  # deposit, refund
@@ -313,6 +394,11 @@ class PaymentLog(Base):
     
     # 관계
     application = relationship("JobApplication", back_populates="payment_logs")
+    
+    __table_args__ = (
+        # 신청별 결제 로그 조회/삭제용
+        Index("ix_payment_log_application", "application_id"),
+    )
 
 class AuditLog(Base):
     """감사 로그"""
@@ -331,12 +417,68 @@ class AuditLog(Base):
 # 테이블 생성
 Base.metadata.create_all(bind=engine)  # 새로운 테이블 생성 (기존 테이블은 유지)
 
+# 유니크 인덱스를 새로 만들기 전에 기존 중복 행을 정리하는 구문 (가장 먼저 저장된 행만 남김)
+UNIQUE_INDEX_DEDUP_STATEMENTS = {
+    "uq_violation_employee_type_occurred": delete(Violation).where(
+        Violation.id.not_in(
+            select(func.min(Violation.id)).group_by(
+                Violation.employee_id, Violation.violation_type, Violation.occurred_at
+            )
+        )
+    ),
+}
+
+def _report_unique_conflicts(conn, table, index):
+    """유니크 인덱스를 막고 있는 중복 값을 경고로 남김 (정리 기준이 없는 테이블은 관리자가 직접 정리)"""
+    columns = list(index.columns)
+    duplicates = conn.execute(
+        select(*columns, func.count())
+        .where(*(column.is_not(None) for column in columns))
+        .group_by(*columns)
+        .having(func.count() > 1)
+    ).all()
+    for row in duplicates:
+        values = ", ".join(f"{column.name}={value!r}" for column, value in zip(columns, row))
+        logger.warning(f"Duplicate rows in {table.name} block {index.name}: {values} ({row[-1]} rows)")
+
+def _create_missing_indexes():
+    """기존 테이블에 나중에 추가된 인덱스 생성 (create_all은 기존 테이블의 인덱스를 만들지 않음)
+    
+    중복 정리 구문이 있는 유니크 인덱스는 중복 방지(ON CONFLICT)가 의존하므로 만들 수 없으면
+    시작을 중단합니다. 그 밖의 인덱스는 실패해도 경고(유니크 인덱스는 중복 값 목록 포함)만 남깁니다.
+    """
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            dedup_statement = UNIQUE_INDEX_DEDUP_STATEMENTS.get(index.name)
+            try:
+                with engine.begin() as conn:
+                    if dedup_statement is not None:
+                        removed = conn.execute(dedup_statement).rowcount
+                        if removed:
+                            logger.warning(f"Removed {removed} duplicate rows from {table.name} before creating {index.name}")
+                    index.create(bind=conn)
+            except Exception as e:
+                if dedup_statement is not None:
+                    raise RuntimeError(f"Unique index {index.name} could not be created: {e}") from e
+                logger.warning(f"Index {index.name} could not be created: {e}")
+                if index.unique:
+                    with engine.connect() as conn:
+                        _report_unique_conflicts(conn, table, index)
+
+_create_missing_indexes()
+
 def get_db():
-    db = SessionLocal()
-    try:
+    # 요청 단위 트랜잭션: 정상 종료 시 커밋, 예외 발생 시에만 롤백 후 세션 종료
+    with SessionLocal.begin() as db:
+        yield db
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 # 암호화 관련 함수들
 def verify_password(plain_password, hashed_password):
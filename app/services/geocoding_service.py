@@ -2,10 +2,39 @@ import requests
 import json
 from typing import Dict, Optional, Tuple
 import os
+from cachetools import TTLCache
+
+# 지오코딩 결과 캐시 (같은 주소/좌표는 외부 API를 다시 호출하지 않음, 성공 결과만 저장)
+GEOCODING_CACHE_TTL_SECONDS = 60 * 60 * 24
+address_cache = TTLCache(maxsize=10000, ttl=GEOCODING_CACHE_TTL_SECONDS)
+reverse_cache = TTLCache(maxsize=10000, ttl=GEOCODING_CACHE_TTL_SECONDS)
+cache_stats = {"hits": 0, "misses": 0}
 
 class GeocodingService:
     """지도 API를 사용한 주소-좌표 변환 서비스"""
     
+    @staticmethod
+    def _address_cache_key(address: str) -> str:
+        """주소 캐시 키 (연속 공백 정리 + 소문자)"""
+        return " ".join(address.split()).lower()
+    
+    @staticmethod
+    def _coordinates_cache_key(latitude: float, longitude: float) -> Tuple[float, float]:
+        """좌표 캐시 키 (소수점 셋째 자리, 약 100m 단위로 반올림)"""
+        return (round(latitude, 3), round(longitude, 3))
+    
+    @staticmethod
+    def get_cache_stats() -> Dict:
+        """지오코딩 캐시 적중 통계"""
+        total = cache_stats["hits"] + cache_stats["misses"]
+        return {
+            "hits": cache_stats["hits"],
+            "misses": cache_stats["misses"],
+            "hit_rate": round(cache_stats["hits"] / total, 3) if total else 0.0,
+            "address_entries": len(address_cache),
+            "coordinate_entries": len(reverse_cache)
+        }
+    
     @staticmethod
     def get_coordinates_from_address(address: str) -> Dict:
         """
@@ -26,6 +55,13 @@ class GeocodingService:
                     "message": "개발 모드: 서울 시청 좌표를 반환합니다."
                 }
             
+            cache_key = GeocodingService._address_cache_key(address)
+            cached = address_cache.get(cache_key)
+            if cached is not None:
+                cache_stats["hits"] += 1
+                return cached
+            cache_stats["misses"] += 1
+            
             # 카카오맵 API 호출
             url = "https://dapi.kakao.com/v2/local/search/address.json"
             headers = {
@@ -51,13 +87,15 @@ class GeocodingService:
                         # 지번 주소만 있는 경우
                         coord_data = result['address']
                     
-                    return {
+                    geocoded = {
                         "success": True,
                         "latitude": float(coord_data['y']),
                         "longitude": float(coord_data['x']),
                         "address": coord_data['address_name'],
                         "message": "주소를 좌표로 변환했습니다."
                     }
+                    address_cache[cache_key] = geocoded
+                    return geocoded
                 else:
                     return {
                         "success": False,
@@ -100,6 +138,13 @@ class GeocodingService:
                     "message": "개발 모드: 샘플 주소를 반환합니다."
                 }
             
+            cache_key = GeocodingService._coordinates_cache_key(latitude, longitude)
+            cached = reverse_cache.get(cache_key)
+            if cached is not None:
+                cache_stats["hits"] += 1
+                return cached
+            cache_stats["misses"] += 1
+            
             url = "https://dapi.kakao.com/v2/local/geo/coord2address.json"
             headers = {
                 "Authorization": f"KakaoAK {KAKAO_API_KEY}"
@@ -123,11 +168,13 @@ class GeocodingService:
                     else:
                         address = result['address']['address_name']
                     
-                    return {
+                    geocoded = {
                         "success": True,
                         "address": address,
                         "message": "좌표를 주소로 변환했습니다."
                     }
+                    reverse_cache[cache_key] = geocoded
+                    return geocoded
                 else:
                     return {
                         "success": False,
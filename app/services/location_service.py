@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from typing import Tuple, Dict, List, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
@@ -26,6 +27,23 @@ class LocationService:
         
         return R * c
     
+    @staticmethod
+    def calculate_distances(lat: float, lng: float, site_lats: np.ndarray, site_lngs: np.ndarray) -> np.ndarray:
+        """한 좌표에서 여러 좌표까지의 거리를 미터 단위로 한 번에 계산 (Haversine 공식, NumPy 벡터 연산)"""
+        R = 6371000  # 지구 반지름 (미터)
+        
+        lat1_rad = math.radians(lat)
+        lat2_rad = np.radians(site_lats)
+        delta_lat = np.radians(site_lats - lat)
+        delta_lng = np.radians(site_lngs - lng)
+        
+        a = (np.sin(delta_lat/2) ** 2 + 
+             math.cos(lat1_rad) * np.cos(lat2_rad) * 
+             np.sin(delta_lng/2) ** 2)
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
+        
+        return R * c
+    
     @staticmethod
     def validate_location_accuracy(accuracy: float) -> bool:
         """위치 정확도 검증 (100m 이내만 신뢰)"""
@@ -74,37 +92,47 @@ class LocationService:
         if not assigned_sites:
             assigned_sites = db.query(Site).all()
         
-        closest_site = None
-        min_distance = float('inf')
+        if not assigned_sites:
+            return {
+                "inside": False,
+                "site": None,
+                "distance": None,
+                "closest_site": None,
+                "min_distance": float('inf')
+            }
         
-        for site in assigned_sites:
-            distance = LocationService.calculate_distance(lat, lng, site.latitude, site.longitude)
-            
-            if distance < min_distance:
-                min_distance = distance
-                closest_site = site
-            
-            # 지오펜스 내부에 있는지 확인
-            if distance <= site.geofence_radius:
-                return {
-                    "inside": True,
-                    "site": site,
-                    "distance": distance,
-                    "closest_site": closest_site,
-                    "min_distance": min_distance
-                }
+        # 모든 사이트까지의 거리를 한 번에 계산
+        distances = LocationService.calculate_distances(
+            lat, lng,
+            np.array([site.latitude for site in assigned_sites], dtype=np.float64),
+            np.array([site.longitude for site in assigned_sites], dtype=np.float64)
+        )
+        inside = distances <= np.array([site.geofence_radius for site in assigned_sites], dtype=np.float64)
+        
+        # 지오펜스 내부에 있는 첫 번째 사이트 (가장 가까운 사이트는 그 사이트까지 중에서 선택)
+        if inside.any():
+            site_index = int(np.argmax(inside))
+            closest_index = int(np.argmin(distances[:site_index + 1]))
+            return {
+                "inside": True,
+                "site": assigned_sites[site_index],
+                "distance": float(distances[site_index]),
+                "closest_site": assigned_sites[closest_index],
+                "min_distance": float(distances[closest_index])
+            }
         
+        closest_index = int(np.argmin(distances))
         return {
             "inside": False,
             "site": None,
             "distance": None,
-            "closest_site": closest_site,
-            "min_distance": min_distance
+            "closest_site": assigned_sites[closest_index],
+            "min_distance": float(distances[closest_index])
         }
     
     @staticmethod
-    def process_location_update(employee_id: int, location_data: dict, db: Session) -> Dict:
-        """위치 업데이트 처리"""
+    def process_location_update(employee_id: int, location_data: dict, db: Session, commit: bool = True) -> Dict:
+        """위치 업데이트 처리 (commit=False면 flush만 하고 커밋은 호출자가 처리)"""
         
         # 1. 이전 위치 조회
         last_location = db.query(LocationEvent).filter(
@@ -161,11 +189,14 @@ class LocationService:
         )
         
         db.add(location_event)
-        db.commit()
+        if commit:
+            db.commit()
+        else:
+            db.flush()
         
         # 7. 출근/퇴근 처리
         attendance_result = LocationService.process_attendance_event(
-            employee_id, event_type, geofence_result, db
+            employee_id, event_type, geofence_result, db, commit
         )
         
         return {
@@ -178,7 +209,33 @@ class LocationService:
         }
     
     @staticmethod
-    def process_attendance_event(employee_id: int, event_type: str, geofence_result: dict, db: Session) -> Dict:
+    def process_location_batch(events: List[Tuple[int, dict]], db: Session) -> List:
+        """위치 업데이트 여러 건을 순서대로 처리하고 한 번만 커밋
+        
+        이벤트별 결과(dict) 목록을 반환하며, 처리 중 오류가 나면 배치를 롤백하고
+        한 건씩 다시 처리하여 실패한 이벤트 자리에는 예외 객체를 넣어 반환
+        """
+        try:
+            results = [
+                LocationService.process_location_update(employee_id, location_data, db, commit=False)
+                for employee_id, location_data in events
+            ]
+            db.commit()
+            return results
+        except Exception:
+            db.rollback()
+        
+        results = []
+        for employee_id, location_data in events:
+            try:
+                results.append(LocationService.process_location_update(employee_id, location_data, db))
+            except Exception as e:
+                db.rollback()
+                results.append(e)
+        return results
+    
+    @staticmethod
+    def process_attendance_event(employee_id: int, event_type: str, geofence_result: dict, db: Session, commit: bool = True) -> Dict:
         """출근/퇴근 이벤트 처리"""
         today = datetime.now().date()
         
@@ -203,7 +260,10 @@ class LocationService:
                     check_in_location=f"{geofence_result['site'].name} ({geofence_result['distance']:.1f}m)"
                 )
                 db.add(attendance)
-                db.commit()
+                if commit:
+                    db.commit()
+                else:
+                    db.flush()
                 
                 return {"action": "check_in", "time": attendance.check_in_time}
         
@@ -218,7 +278,10 @@ class LocationService:
                 work_duration = attendance.check_out_time - attendance.check_in_time
                 attendance.total_work_minutes = int(work_duration.total_seconds() / 60)
             
-            db.commit()
+            if commit:
+                db.commit()
+            else:
+                db.flush()
             
             return {"action": "check_out", "time": attendance.check_out_time}
         
@@ -1,17 +1,20 @@
 import requests
+import httpx
 import json
 import hashlib
 import hmac
 import uuid
 from datetime import datetime
 from typing import Dict, Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.database import JobApplication, PaymentLog
 
 class NaverPayService:
     """네이버페이 결제 서비스"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         import os
         # 네이버페이 API 설정 (환경변수에서 로드)
         self.client_id = os.getenv("NAVER_PAY_CLIENT_ID", "YOUR_NAVER_PAY_CLIENT_ID")
@@ -24,7 +27,10 @@ class NaverPayService:
         if self.is_production:
             self.base_url = "https://pay.naver.com"
         
-    def create_payment_request(self, application_id: int, amount: int, user_name: str) -> Dict:
+        # 결제 요청용 비동기 HTTP 클라이언트 (연결 재사용)
+        self.client = client or httpx.AsyncClient(limits=httpx.Limits(max_connections=100))
+        
+    async def create_payment_request(self, application_id: int, amount: int, user_name: str) -> Dict:
         """결제 요청 생성"""
         
         # 고유한 거래 ID 생성
@@ -59,7 +65,7 @@ class NaverPayService:
         # API 요청
         try:
             headers = self._get_headers()
-            response = requests.post(
+            response = await self.client.post(
                 f"{self.base_url}/payments/recurrent/regist/v1/payment",
                 headers=headers,
                 json=payment_data,
@@ -83,7 +89,7 @@ class NaverPayService:
                     "code": result.get("code")
                 }
                 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return {
                 "success": False,
                 "error": f"네트워크 오류: {str(e)}"
@@ -193,14 +199,19 @@ class NaverPayService:
 class PaymentManager:
     """결제 관리 서비스"""
     
-    def __init__(self):
-        self.naver_pay = NaverPayService()
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client or httpx.AsyncClient(limits=httpx.Limits(max_connections=100))
+        self.naver_pay = NaverPayService(self.client)
+    
+    async def aclose(self):
+        """HTTP 클라이언트 연결 종료"""
+        await self.client.aclose()
     
-    def initiate_deposit_payment(self, application_id: int, user_name: str, db: Session) -> Dict:
+    async def initiate_deposit_payment(self, application_id: int, user_name: str, db: AsyncSession) -> Dict:
         """보증금 결제 시작"""
         
         # 신청 정보 조회
-        application = db.query(JobApplication).filter(JobApplication.id == application_id).first()
+        application = await db.scalar(select(JobApplication).where(JobApplication.id == application_id))
         if not application:
             return {"success": False, "error": "신청 정보를 찾을 수 없습니다."}
         
@@ -208,7 +219,7 @@ class PaymentManager:
             return {"success": False, "error": "이미 보증금이 결제되었습니다."}
         
         # 결제 요청 생성
-        payment_result = self.naver_pay.create_payment_request(
+        payment_result = await self.naver_pay.create_payment_request(
             application_id, 
             application.deposit_amount, 
             user_name
@@ -225,7 +236,7 @@ class PaymentManager:
                 payment_data=json.dumps(payment_result["payment_data"])
             )
             db.add(payment_log)
-            db.commit()
+            await db.commit()
             
             return {
                 "success": True,
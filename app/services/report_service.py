@@ -11,7 +11,7 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import json
 from io import BytesIO
 import csv
@@ -390,33 +390,30 @@ class ReportService:
         }
     
     @staticmethod
-    def export_report_to_csv(report_data: Dict) -> str:
-        """리포트 데이터를 CSV 형태로 변환"""
-        output = io.StringIO()
-        
+    def iter_csv_rows(report_data: Dict) -> Iterator[List]:
+        """리포트 데이터를 CSV 행 단위로 생성"""
         if report_data["report_type"] == "daily":
             # 일간 리포트 CSV
-            writer = csv.writer(output)
-            writer.writerow(["일간 출근 리포트"])
-            writer.writerow(["날짜", report_data["target_date"]])
-            writer.writerow(["생성시간", report_data["generated_at"].strftime("%Y-%m-%d %H:%M")])
-            writer.writerow([])
+            yield ["일간 출근 리포트"]
+            yield ["날짜", report_data["target_date"]]
+            yield ["생성시간", report_data["generated_at"].strftime("%Y-%m-%d %H:%M")]
+            yield []
             
             # 요약 통계
-            writer.writerow(["요약 통계"])
-            writer.writerow(["총 직원수", report_data["summary"]["total_employees"]])
-            writer.writerow(["출근자수", report_data["summary"]["present_count"]])
-            writer.writerow(["결근자수", report_data["summary"]["absent_count"]])
-            writer.writerow(["지각자수", report_data["summary"]["late_count"]])
-            writer.writerow(["출근율", f"{report_data['summary']['attendance_rate']}%"])
-            writer.writerow([])
+            yield ["요약 통계"]
+            yield ["총 직원수", report_data["summary"]["total_employees"]]
+            yield ["출근자수", report_data["summary"]["present_count"]]
+            yield ["결근자수", report_data["summary"]["absent_count"]]
+            yield ["지각자수", report_data["summary"]["late_count"]]
+            yield ["출근율", f"{report_data['summary']['attendance_rate']}%"]
+            yield []
             
             # 상세 기록
-            writer.writerow(["상세 출근 기록"])
-            writer.writerow(["직원번호", "이름", "부서", "직급", "출근시간", "퇴근시간", "근무시간", "근무지", "상태"])
+            yield ["상세 출근 기록"]
+            yield ["직원번호", "이름", "부서", "직급", "출근시간", "퇴근시간", "근무시간", "근무지", "상태"]
             
             for record in report_data["detailed_records"]:
-                writer.writerow([
+                yield [
                     record["employee_number"],
                     record["employee_name"],
                     record["department"],
@@ -426,30 +423,29 @@ class ReportService:
                     record["total_work_hours"],
                     record["site_name"],
                     record["status"]
-                ])
+                ]
         
         elif report_data["report_type"] == "monthly":
             # 월간 리포트 CSV
-            writer = csv.writer(output)
-            writer.writerow([f"월간 출근 리포트 - {report_data['month_name']}"])
-            writer.writerow(["생성시간", report_data["generated_at"].strftime("%Y-%m-%d %H:%M")])
-            writer.writerow([])
+            yield [f"월간 출근 리포트 - {report_data['month_name']}"]
+            yield ["생성시간", report_data["generated_at"].strftime("%Y-%m-%d %H:%M")]
+            yield []
             
             # 요약 통계
-            writer.writerow(["요약 통계"])
-            writer.writerow(["총 직원수", report_data["summary"]["total_employees"]])
-            writer.writerow(["총 출근 기록", report_data["summary"]["total_work_records"]])
-            writer.writerow(["총 지각 기록", report_data["summary"]["total_late_records"]])
-            writer.writerow(["총 근무시간", f"{report_data['summary']['total_work_hours']}시간"])
-            writer.writerow(["평균 출근율", f"{report_data['summary']['avg_attendance_rate']}%"])
-            writer.writerow([])
+            yield ["요약 통계"]
+            yield ["총 직원수", report_data["summary"]["total_employees"]]
+            yield ["총 출근 기록", report_data["summary"]["total_work_records"]]
+            yield ["총 지각 기록", report_data["summary"]["total_late_records"]]
+            yield ["총 근무시간", f"{report_data['summary']['total_work_hours']}시간"]
+            yield ["평균 출근율", f"{report_data['summary']['avg_attendance_rate']}%"]
+            yield []
             
             # 직원별 통계
-            writer.writerow(["직원별 월간 통계"])
-            writer.writerow(["직원번호", "이름", "부서", "근무일수", "지각횟수", "조기퇴근횟수", "총 근무시간", "평균 근무시간", "출근율"])
+            yield ["직원별 월간 통계"]
+            yield ["직원번호", "이름", "부서", "근무일수", "지각횟수", "조기퇴근횟수", "총 근무시간", "평균 근무시간", "출근율"]
             
             for emp_stats in report_data["employee_stats"]:
-                writer.writerow([
+                yield [
                     emp_stats["employee_number"],
                     emp_stats["employee_name"],
                     emp_stats["department"],
@@ -459,29 +455,28 @@ class ReportService:
                     f"{emp_stats['total_hours']}시간",
                     f"{emp_stats['avg_hours']}시간",
                     f"{emp_stats['attendance_rate']}%"
-                ])
+                ]
         
         elif report_data["report_type"] == "violations":
             # 위반사항 리포트 CSV
-            writer = csv.writer(output)
-            writer.writerow([f"위반사항 리포트 ({report_data['start_date']} ~ {report_data['end_date']})"])
-            writer.writerow(["생성시간", report_data["generated_at"].strftime("%Y-%m-%d %H:%M")])
-            writer.writerow([])
+            yield [f"위반사항 리포트 ({report_data['start_date']} ~ {report_data['end_date']})"]
+            yield ["생성시간", report_data["generated_at"].strftime("%Y-%m-%d %H:%M")]
+            yield []
             
             # 요약 통계
-            writer.writerow(["요약 통계"])
-            writer.writerow(["총 위반건수", report_data["summary"]["total_violations"]])
-            writer.writerow(["대기중 위반", report_data["summary"]["pending_violations"]])
-            writer.writerow(["해결된 위반", report_data["summary"]["resolved_violations"]])
-            writer.writerow(["고심각도 위반", report_data["summary"]["high_severity_violations"]])
-            writer.writerow([])
+            yield ["요약 통계"]
+            yield ["총 위반건수", report_data["summary"]["total_violations"]]
+            yield ["대기중 위반", report_data["summary"]["pending_violations"]]
+            yield ["해결된 위반", report_data["summary"]["resolved_violations"]]
+            yield ["고심각도 위반", report_data["summary"]["high_severity_violations"]]
+            yield []
             
             # 위반 상세 기록
-            writer.writerow(["위반사항 상세 기록"])
-            writer.writerow(["직원명", "직원번호", "부서", "위반유형", "심각도", "발생시간", "설명", "상태", "자동감지"])
+            yield ["위반사항 상세 기록"]
+            yield ["직원명", "직원번호", "부서", "위반유형", "심각도", "발생시간", "설명", "상태", "자동감지"]
             
             for violation in report_data["detailed_violations"]:
-                writer.writerow([
+                yield [
                     violation["employee_name"],
                     violation["employee_number"],
                     violation["department"],
@@ -491,12 +486,35 @@ class ReportService:
                     violation["description"],
                     violation["status_text"],
                     "예" if violation["auto_detected"] else "아니오"
-                ])
+                ]
+
+    @staticmethod
+    def iter_report_csv(report_data: Dict, chunk_rows: int = 100) -> Iterator[bytes]:
+        """리포트 CSV를 UTF-8 바이트 조각으로 생성 (스트리밍 응답용, BOM 포함으로 한글 깨짐 방지)"""
+        yield "\ufeff".encode("utf-8")
         
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row_count, row in enumerate(ReportService.iter_csv_rows(report_data), start=1):
+            writer.writerow(row)
+            # chunk_rows 행마다 버퍼를 비워 전체 CSV를 메모리에 쌓지 않음
+            if row_count % chunk_rows == 0:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate(0)
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+    
+    @staticmethod
+    def export_report_to_csv(report_data: Dict) -> str:
+        """리포트 데이터를 CSV 형태로 변환"""
+        output = io.StringIO()
+        csv.writer(output).writerows(ReportService.iter_csv_rows(report_data))
         csv_content = output.getvalue()
         output.close()
         return csv_content
     
+    
     @staticmethod
     def _get_violation_type_text(violation_type: str) -> str:
         """위반 유형 한글 변환"""
@@ -9,17 +9,114 @@
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, case, extract
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timedelta, time
 from typing import Dict, List, Optional, Tuple
+from cachetools import TTLCache
+from bisect import bisect_left, insort
+import threading
 import json
 
+import pandas as pd
+
 from ..models.database import (
-    User, Employee, AttendanceRecord, LocationEvent, 
+    User, AttendanceRecord, LocationEvent, 
     Department, Site, Violation, Company
 )
 
 
+# 최근에 검사를 마친 (레코드 ID, 위반 유형) 캐시
+# 스케줄러가 몇 분마다 최근 24시간을 다시 스캔할 때 이미 확인한 기록은 건너뜁니다.
+_PROCESSED = TTLCache(maxsize=200_000, ttl=600)
+_PROCESSED_LOCK = threading.Lock()
+
+
+def _is_processed(key: Tuple) -> bool:
+    with _PROCESSED_LOCK:
+        return key in _PROCESSED
+
+
+def _mark_processed(keys: List[Tuple]) -> None:
+    with _PROCESSED_LOCK:
+        for key in keys:
+            _PROCESSED[key] = True
+
+
+# 지각/조기퇴근 시간(분)별 심각도 조회 테이블 (1440분 이상은 마지막 값 사용)
+_LATE_SEVERITY = ('low',) * 30 + ('medium',) * 30 + ('high',) * (1441 - 60)  # 30분 / 1시간 기준
+_EARLY_LEAVE_SEVERITY = ('low',) * 60 + ('medium',) * 60 + ('high',) * (1441 - 120)  # 1시간 / 2시간 기준
+
+
+# 위반 사항 일괄 저장 시 한 번에 보내는 행 수
+_INSERT_CHUNK_SIZE = 500
+
+
+def _save_violations(db: Session, violations: List[Dict]) -> None:
+    """감지된 위반 사항 일괄 저장 (이미 저장된 위반은 유니크 인덱스 충돌로 무시)"""
+    if not violations:
+        return
+    
+    rows = [{'attendance_record_id': None, **violation} for violation in violations]
+    dialect = db.get_bind().dialect.name
+    
+    if dialect in ('postgresql', 'sqlite'):
+        insert = pg_insert if dialect == 'postgresql' else sqlite_insert
+        stmt = insert(Violation).on_conflict_do_nothing()
+        for i in range(0, len(rows), _INSERT_CHUNK_SIZE):
+            db.execute(stmt, rows[i:i + _INSERT_CHUNK_SIZE])
+        return
+    
+    # ON CONFLICT를 지원하지 않는 DB는 행 단위 SAVEPOINT로 중복만 건너뜀
+    for row in rows:
+        try:
+            with db.begin_nested():
+                db.add(Violation(**row))
+        except IntegrityError:
+            pass
+
+
+# 위치 위반 중복 판단 시간 범위 (같은 직원/유형의 위반이 ±5분 안에 있으면 새로 저장하지 않음)
+_LOCATION_DEDUP_WINDOW = timedelta(minutes=5)
+
+
+def _drop_recent_duplicates(db: Session, violations: List[Dict], window: timedelta) -> List[Dict]:
+    """이미 저장됐거나 같은 배치에서 먼저 감지된 위반과 window 이내로 가까운 위반 제외
+    
+    GPS 신호가 흔들려 몇 초 간격으로 같은 위반이 반복 감지되어도 한 건만 저장되도록 합니다.
+    기존 위반은 대상 직원/유형/시간 범위로 한 번만 조회합니다.
+    """
+    if not violations:
+        return violations
+    
+    occurred = [v['occurred_at'] for v in violations]
+    existing = db.query(Violation.employee_id, Violation.violation_type, Violation.occurred_at).filter(
+        Violation.employee_id.in_({v['employee_id'] for v in violations}),
+        Violation.violation_type.in_({v['violation_type'] for v in violations}),
+        Violation.occurred_at >= min(occurred) - window,
+        Violation.occurred_at <= max(occurred) + window
+    ).all()
+    
+    # (직원, 유형)별 위반 발생 시각 (정렬 유지)
+    seen: Dict[Tuple, List[datetime]] = {}
+    for employee_id, violation_type, occurred_at in existing:
+        seen.setdefault((employee_id, violation_type), []).append(occurred_at)
+    for times in seen.values():
+        times.sort()
+    
+    kept = []
+    for violation in sorted(violations, key=lambda v: v['occurred_at']):
+        times = seen.setdefault((violation['employee_id'], violation['violation_type']), [])
+        i = bisect_left(times, violation['occurred_at'] - window)
+        if i < len(times) and times[i] <= violation['occurred_at'] + window:
+            continue
+        insort(times, violation['occurred_at'])
+        kept.append(violation)
+    return kept
+
+
 class ViolationDetectionService:
     """위반 사항 자동 감지 서비스"""
     
@@ -29,40 +126,75 @@ class ViolationDetectionService:
     LATE_THRESHOLD_MINUTES = 10  # 10분 이상 지각시 위반
     EARLY_LEAVE_THRESHOLD_MINUTES = 30  # 30분 이상 조기퇴근시 위반
     
+    # 근무 패턴 분석 슬라이딩 윈도우 설정
+    PATTERN_WINDOW_DAYS = 7  # 윈도우 길이 (ω)
+    PATTERN_STRIDE_DAYS = 1  # 윈도우 이동 간격 (δ)
+    PATTERN_MIN_RECORDS = 3  # 윈도우 내 최소 출근 기록 수
+    
     @staticmethod
-    def detect_attendance_violations(db: Session, start_time: datetime = None) -> Dict:
+    def detect_attendance_violations(db: Session, start_time: datetime = None, now: datetime = None) -> Dict:
         """출근 기록 기반 위반 사항 감지"""
         
         if not start_time:
-            start_time = datetime.now() - timedelta(hours=24)
-        
-        # 최근 출근 기록 조회
-        recent_records = db.query(AttendanceRecord).filter(
-            AttendanceRecord.check_in_time >= start_time
-        ).all()
+            start_time = (now or datetime.now()) - timedelta(hours=24)
+        
+        # 근무지별 지각/조기퇴근 기준 시각 (자정 기준 분 단위)
+        sites = {site.id: site for site in db.query(Site).all()}
+        late_after_minutes = {}
+        early_before_minutes = {}
+        for site_id, site in sites.items():
+            scheduled_start = ViolationDetectionService._get_scheduled_start_time(site)
+            scheduled_end = ViolationDetectionService._get_scheduled_end_time(site)
+            late_after_minutes[site_id] = (
+                scheduled_start.hour * 60 + scheduled_start.minute
+                + ViolationDetectionService.LATE_THRESHOLD_MINUTES
+            )
+            early_before_minutes[site_id] = (
+                scheduled_end.hour * 60 + scheduled_end.minute
+                - ViolationDetectionService.EARLY_LEAVE_THRESHOLD_MINUTES
+            )
+        
+        # 위반 가능성이 있는 출근 기록만 조회 (지각 / 조기퇴근 / 짧은 근무시간 후보)
+        recent_records = []
+        if sites:
+            check_in_minute = (
+                extract('hour', AttendanceRecord.check_in_time) * 60
+                + extract('minute', AttendanceRecord.check_in_time)
+            )
+            check_out_minute = (
+                extract('hour', AttendanceRecord.check_out_time) * 60
+                + extract('minute', AttendanceRecord.check_out_time)
+            )
+            recent_records = db.query(AttendanceRecord).filter(
+                AttendanceRecord.check_in_time >= start_time,
+                AttendanceRecord.site_id.in_(list(sites)),
+                or_(
+                    check_in_minute >= case(late_after_minutes, value=AttendanceRecord.site_id),
+                    and_(
+                        AttendanceRecord.check_out_time.isnot(None),
+                        check_out_minute <= case(early_before_minutes, value=AttendanceRecord.site_id)
+                    ),
+                    and_(
+                        AttendanceRecord.check_out_time.isnot(None),
+                        AttendanceRecord.total_work_minutes < 240
+                    )
+                )
+            ).all()
         
         detected_violations = []
+        processed_keys = []
         
         for record in recent_records:
-            violations = ViolationDetectionService._analyze_attendance_record(record, db)
+            violations = ViolationDetectionService._analyze_attendance_record(
+                record, sites[record.site_id], db
+            )
             detected_violations.extend(violations)
+            processed_keys.extend(ViolationDetectionService._attendance_check_keys(record))
         
         # 데이터베이스에 저장
-        for violation_data in detected_violations:
-            # 중복 확인
-            existing = db.query(Violation).filter(
-                Violation.employee_id == violation_data['employee_id'],
-                Violation.attendance_record_id == violation_data.get('attendance_record_id'),
-                Violation.violation_type == violation_data['violation_type'],
-                Violation.occurred_at >= violation_data['occurred_at'] - timedelta(minutes=5),
-                Violation.occurred_at <= violation_data['occurred_at'] + timedelta(minutes=5)
-            ).first()
-            
-            if not existing:
-                violation = Violation(**violation_data)
-                db.add(violation)
-        
+        _save_violations(db, detected_violations)
         db.commit()
+        _mark_processed(processed_keys)
         
         return {
             "detected_count": len(detected_violations),
@@ -70,13 +202,27 @@ class ViolationDetectionService:
         }
     
     @staticmethod
-    def _analyze_attendance_record(record: AttendanceRecord, db: Session) -> List[Dict]:
+    def _attendance_check_keys(record: AttendanceRecord) -> List[Tuple]:
+        """입력값이 확정되어 결과가 더 이상 바뀌지 않는 검사의 캐시 키 목록"""
+        keys = []
+        if record.check_in_time:
+            keys.append((record.id, 'late_arrival'))
+        if record.check_out_time:
+            keys.append((record.id, 'early_departure'))
+            keys.append((record.id, 'insufficient_work_hours'))
+        return keys
+    
+    @staticmethod
+    def _analyze_attendance_record(record: AttendanceRecord, site: Site, db: Session) -> List[Dict]:
         """개별 출근 기록 분석"""
         violations = []
         
-        # 근무지 정보 조회
-        site = db.query(Site).filter(Site.id == record.site_id).first()
-        if not site:
+        # 이전 실행에서 이미 검사한 항목은 건너뜀
+        pending_types = {
+            key[1] for key in ViolationDetectionService._attendance_check_keys(record)
+            if not _is_processed(key)
+        }
+        if not pending_types:
             return violations
         
         # 예정된 근무 시간 vs 실제 근무 시간 비교
@@ -84,7 +230,7 @@ class ViolationDetectionService:
         scheduled_end = ViolationDetectionService._get_scheduled_end_time(site)
         
         # 지각 검사
-        if record.check_in_time and scheduled_start:
+        if 'late_arrival' in pending_types and record.check_in_time and scheduled_start:
             actual_start = record.check_in_time.time()
             
             # 지각 시간 계산
@@ -99,7 +245,7 @@ class ViolationDetectionService:
                         record.is_late = True
                         db.commit()
                     
-                    severity = ViolationDetectionService._determine_late_severity(late_minutes)
+                    severity = _LATE_SEVERITY[min(late_minutes, 1440)]
                     
                     violations.append({
                         'employee_id': record.employee_id,
@@ -117,7 +263,7 @@ class ViolationDetectionService:
                     })
         
         # 조기 퇴근 검사
-        if record.check_out_time and scheduled_end:
+        if 'early_departure' in pending_types and record.check_out_time and scheduled_end:
             actual_end = record.check_out_time.time()
             
             # 조기 퇴근 시간 계산
@@ -132,7 +278,7 @@ class ViolationDetectionService:
                         record.is_early_leave = True
                         db.commit()
                     
-                    severity = ViolationDetectionService._determine_early_leave_severity(early_minutes)
+                    severity = _EARLY_LEAVE_SEVERITY[min(early_minutes, 1440)]
                     
                     violations.append({
                         'employee_id': record.employee_id,
@@ -149,13 +295,13 @@ class ViolationDetectionService:
                         })
                     })
         
-        # 비정상적으로 짧은 근무시간 검사
-        if record.check_in_time and record.check_out_time:
-            work_duration = record.check_out_time - record.check_in_time
-            work_hours = work_duration.total_seconds() / 3600
+        # 비정상적으로 짧은 근무시간 검사 (퇴근 처리 시 계산된 total_work_minutes 사용)
+        if ('insufficient_work_hours' in pending_types and record.check_in_time and record.check_out_time
+                and record.total_work_minutes is not None):
+            work_hours = record.total_work_minutes / 60
             
             # 4시간 미만 근무시 의심
-            if work_hours < 4:
+            if record.total_work_minutes < 240:
                 violations.append({
                     'employee_id': record.employee_id,
                     'attendance_record_id': record.id,
@@ -174,11 +320,11 @@ class ViolationDetectionService:
         return violations
     
     @staticmethod
-    def detect_location_violations(db: Session, start_time: datetime = None) -> Dict:
+    def detect_location_violations(db: Session, start_time: datetime = None, now: datetime = None) -> Dict:
         """위치 기반 위반 사항 감지"""
         
         if not start_time:
-            start_time = datetime.now() - timedelta(hours=24)
+            start_time = (now or datetime.now()) - timedelta(hours=24)
         
         # 최근 위치 이벤트 조회
         recent_events = db.query(LocationEvent).filter(
@@ -187,25 +333,17 @@ class ViolationDetectionService:
         
         detected_violations = []
         
+        processed_keys = []
+        
         for event in recent_events:
             violations = ViolationDetectionService._analyze_location_event(event, db)
             detected_violations.extend(violations)
+            processed_keys.append((event.id, 'location_event'))
         
-        # 데이터베이스에 저장
-        for violation_data in detected_violations:
-            # 중복 확인
-            existing = db.query(Violation).filter(
-                Violation.employee_id == violation_data['employee_id'],
-                Violation.violation_type == violation_data['violation_type'],
-                Violation.occurred_at >= violation_data['occurred_at'] - timedelta(minutes=5),
-                Violation.occurred_at <= violation_data['occurred_at'] + timedelta(minutes=5)
-            ).first()
-            
-            if not existing:
-                violation = Violation(**violation_data)
-                db.add(violation)
-        
+        # 데이터베이스에 저장 (짧은 시간 안에 반복 감지된 위반은 한 건만 저장)
+        _save_violations(db, _drop_recent_duplicates(db, detected_violations, _LOCATION_DEDUP_WINDOW))
         db.commit()
+        _mark_processed(processed_keys)
         
         return {
             "detected_count": len(detected_violations),
@@ -217,6 +355,10 @@ class ViolationDetectionService:
         """개별 위치 이벤트 분석"""
         violations = []
         
+        # 위치 이벤트는 기록 후 변하지 않으므로 이벤트 단위로 건너뜀
+        if _is_processed((event.id, 'location_event')):
+            return violations
+        
         # GPS 정확도 검사
         if event.accuracy and event.accuracy > 1000:  # 1km 이상의 오차
             violations.append({
@@ -269,42 +411,31 @@ class ViolationDetectionService:
         return violations
     
     @staticmethod
-    def detect_pattern_violations(db: Session, start_date: datetime = None) -> Dict:
+    def detect_pattern_violations(db: Session, start_date: datetime = None, now: datetime = None) -> Dict:
         """근무 패턴 기반 위반 사항 감지"""
         
         if not start_date:
-            start_date = datetime.now() - timedelta(days=7)  # 최근 7일
+            start_date = (now or datetime.now()) - timedelta(days=7)  # 최근 7일
         
         detected_violations = []
         
-        # 모든 직원에 대해 분석
-        employees = db.query(Employee).all()
+        # 해당 기간 내 출근 기록이 충분한 직원 (그보다 적으면 분석하기에 데이터가 부족함)
+        eligible_employees = db.query(AttendanceRecord.employee_id).filter(
+            AttendanceRecord.check_in_time >= start_date
+        ).group_by(AttendanceRecord.employee_id).having(
+            func.count(AttendanceRecord.id) >= ViolationDetectionService.PATTERN_MIN_RECORDS
+        ).subquery()
         
-        for employee in employees:
-            # 해당 기간 내 출근 기록
-            records = db.query(AttendanceRecord).filter(
-                AttendanceRecord.employee_id == employee.id,
-                AttendanceRecord.check_in_time >= start_date
-            ).all()
-            
-            if len(records) < 3:  # 분석하기에 충분한 데이터가 없음
-                continue
-            
-            violations = ViolationDetectionService._analyze_work_patterns(employee, records, db)
-            detected_violations.extend(violations)
+        # 대상 직원들의 출근 기록을 한 번에 조회하여 직원별로 분석
+        records = db.query(AttendanceRecord).filter(
+            AttendanceRecord.check_in_time >= start_date,
+            AttendanceRecord.employee_id.in_(db.query(eligible_employees.c.employee_id))
+        ).order_by(AttendanceRecord.employee_id, AttendanceRecord.id).all()
         
-        # 데이터베이스에 저장
-        for violation_data in detected_violations:
-            existing = db.query(Violation).filter(
-                Violation.employee_id == violation_data['employee_id'],
-                Violation.violation_type == violation_data['violation_type'],
-                Violation.occurred_at >= violation_data['occurred_at'] - timedelta(hours=1)
-            ).first()
-            
-            if not existing:
-                violation = Violation(**violation_data)
-                db.add(violation)
+        detected_violations.extend(ViolationDetectionService._analyze_work_patterns(records))
         
+        # 데이터베이스에 저장
+        _save_violations(db, detected_violations)
         db.commit()
         
         return {
@@ -313,53 +444,99 @@ class ViolationDetectionService:
         }
     
     @staticmethod
-    def _analyze_work_patterns(employee: Employee, records: List[AttendanceRecord], db: Session) -> List[Dict]:
-        """개별 직원의 근무 패턴 분석"""
-        violations = []
+    def _analyze_work_patterns(records: List[AttendanceRecord]) -> List[Dict]:
+        """직원별 근무 패턴 분석 (슬라이딩 윈도우)
+        
+        전체 출근 기록을 하나의 DataFrame으로 만들어 직원별로 묶은 뒤,
+        ω(PATTERN_WINDOW_DAYS)일 길이의 윈도우를 δ(PATTERN_STRIDE_DAYS)일 간격으로 이동하며
+        지각 비율과 평균 근무시간을 계산하고, 직원마다 기준을 넘은 가장 최근 윈도우를 위반으로 기록합니다.
+        """
+        if not records:
+            return []
+        
+        window_days = ViolationDetectionService.PATTERN_WINDOW_DAYS
+        stride_days = ViolationDetectionService.PATTERN_STRIDE_DAYS
+        min_records = ViolationDetectionService.PATTERN_MIN_RECORDS
+        
+        df = pd.DataFrame({
+            'employee_id': [r.employee_id for r in records],
+            'check_in_time': [r.check_in_time for r in records],
+            'late': [1.0 if r.is_late else 0.0 for r in records],
+            'work_hours': pd.Series(
+                [r.total_work_minutes / 60 if r.total_work_minutes else None for r in records], dtype=float
+            ),
+        }).sort_values(['employee_id', 'check_in_time'], kind='stable').set_index('check_in_time')
+        
+        # 직원별로 각 출근 기록 시각에서 끝나는 ω일 윈도우 집계
+        rolling = df.groupby('employee_id').rolling(pd.Timedelta(days=window_days))
+        windows = pd.DataFrame({
+            'total_days': rolling['late'].count(),
+            'late_days': rolling['late'].sum(),
+            'work_days': rolling['work_hours'].count(),
+            'work_hours_sum': rolling['work_hours'].sum(),
+        })
+        
+        # 같은 시각의 기록이 여러 건이면 마지막 행이 해당 윈도우 전체를 포함
+        windows = windows[~windows.index.duplicated(keep='last')]
+        windows['window_end'] = windows.index.get_level_values('check_in_time')
+        
+        # 직원별 가장 최근 기록을 기준으로 δ일마다 하나의 윈도우만 평가
+        windows = windows.reset_index(level='employee_id').groupby('employee_id').resample(
+            pd.Timedelta(days=stride_days), origin='end', closed='right', label='right'
+        ).last().dropna(subset=['total_days'])
+        windows = windows[windows['total_days'] >= min_records]
         
-        # 지각 빈도 분석
-        late_count = len([r for r in records if r.is_late])
-        late_rate = late_count / len(records) if records else 0
+        violations = []
         
-        if late_rate > 0.5:  # 50% 이상 지각
+        # 지각 빈도 분석 (50% 초과 지각)
+        late_windows = windows[windows['late_days'] / windows['total_days'] > 0.5]
+        for (employee_id, _), window in late_windows.groupby(level='employee_id').tail(1).iterrows():
+            window_end = window['window_end'].to_pydatetime()
+            total_days = int(window['total_days'])
+            late_count = int(window['late_days'])
+            late_rate = late_count / total_days
+            
             violations.append({
-                'employee_id': employee.id,
+                'employee_id': int(employee_id),
                 'violation_type': 'frequent_lateness',
                 'severity': 'medium',
-                'occurred_at': datetime.now(),
-                'description': f"빈번한 지각: 최근 {len(records)}일 중 {late_count}일 지각 ({late_rate:.1%})",
+                'occurred_at': window_end,
+                'description': f"빈번한 지각: 최근 {total_days}일 중 {late_count}일 지각 ({late_rate:.1%})",
                 'auto_detected': True,
                 'evidence_data': json.dumps({
-                    'total_days': len(records),
+                    'total_days': total_days,
                     'late_days': late_count,
-                    'late_rate': late_rate
+                    'late_rate': late_rate,
+                    'window_start': (window_end - timedelta(days=window_days)).isoformat(),
+                    'window_end': window_end.isoformat()
                 })
             })
         
-        # 비정상적인 근무시간 패턴
-        work_hours = []
-        for record in records:
-            if record.total_work_minutes:
-                work_hours.append(record.total_work_minutes / 60)
-        
-        if work_hours:
-            avg_hours = sum(work_hours) / len(work_hours)
+        # 비정상적인 근무시간 패턴 (평균 3시간 미만 근무)
+        worked_windows = windows[windows['work_days'] > 0]
+        short_windows = worked_windows[worked_windows['work_hours_sum'] / worked_windows['work_days'] < 3]
+        for (employee_id, _), window in short_windows.groupby(level='employee_id').tail(1).iterrows():
+            window_end = window['window_end'].to_pydatetime()
+            work_days = int(window['work_days'])
+            avg_hours = float(window['work_hours_sum']) / work_days
             
-            # 평균 3시간 미만 근무
-            if avg_hours < 3:
-                violations.append({
-                    'employee_id': employee.id,
-                    'violation_type': 'insufficient_average_hours',
-                    'severity': 'medium',
-                    'occurred_at': datetime.now(),
-                    'description': f"비정상적으로 짧은 평균 근무시간: {avg_hours:.1f}시간",
-                    'auto_detected': True,
-                    'evidence_data': json.dumps({
-                        'average_hours': avg_hours,
-                        'work_days': len(work_hours)
-                    })
+            violations.append({
+                'employee_id': int(employee_id),
+                'violation_type': 'insufficient_average_hours',
+                'severity': 'medium',
+                'occurred_at': window_end,
+                'description': f"비정상적으로 짧은 평균 근무시간: {avg_hours:.1f}시간",
+                'auto_detected': True,
+                'evidence_data': json.dumps({
+                    'average_hours': avg_hours,
+                    'work_days': work_days,
+                    'window_start': (window_end - timedelta(days=window_days)).isoformat(),
+                    'window_end': window_end.isoformat()
                 })
+            })
         
+        # 직원 순서대로 정렬 (같은 직원은 지각 → 근무시간 순)
+        violations.sort(key=lambda v: v['employee_id'])
         return violations
     
     @staticmethod
@@ -386,34 +563,11 @@ class ViolationDetectionService:
     
     @staticmethod
     def _calculate_time_difference_minutes(time1: time, time2: time) -> int:
-        """두 시간 간의 차이를 분 단위로 반환"""
-        datetime1 = datetime.combine(datetime.today(), time1)
-        datetime2 = datetime.combine(datetime.today(), time2)
-        
-        if datetime2 < datetime1:
-            datetime2 += timedelta(days=1)
+        """두 시간 간의 차이를 분 단위로 반환 (time2가 더 이르면 다음 날로 간주)"""
+        micros1 = ((time1.hour * 60 + time1.minute) * 60 + time1.second) * 1_000_000 + time1.microsecond
+        micros2 = ((time2.hour * 60 + time2.minute) * 60 + time2.second) * 1_000_000 + time2.microsecond
         
-        return int((datetime2 - datetime1).total_seconds() / 60)
-    
-    @staticmethod
-    def _determine_late_severity(late_minutes: int) -> str:
-        """지각 시간에 따른 심각도 결정"""
-        if late_minutes >= 60:  # 1시간 이상
-            return 'high'
-        elif late_minutes >= 30:  # 30분 이상
-            return 'medium'
-        else:
-            return 'low'
-    
-    @staticmethod
-    def _determine_early_leave_severity(early_minutes: int) -> str:
-        """조기 퇴근 시간에 따른 심각도 결정"""
-        if early_minutes >= 120:  # 2시간 이상
-            return 'high'
-        elif early_minutes >= 60:  # 1시간 이상
-            return 'medium'
-        else:
-            return 'low'
+        return (micros2 - micros1) % (24 * 60 * 60 * 1_000_000) // 60_000_000
     
     @staticmethod
     def run_comprehensive_detection(db: Session) -> Dict:
@@ -421,13 +575,13 @@ class ViolationDetectionService:
         start_time = datetime.now()
         
         # 출근 기록 기반 감지
-        attendance_result = ViolationDetectionService.detect_attendance_violations(db)
+        attendance_result = ViolationDetectionService.detect_attendance_violations(db, now=start_time)
         
         # 위치 기반 감지
-        location_result = ViolationDetectionService.detect_location_violations(db)
+        location_result = ViolationDetectionService.detect_location_violations(db, now=start_time)
         
         # 패턴 기반 감지 (주간 단위)
-        pattern_result = ViolationDetectionService.detect_pattern_violations(db)
+        pattern_result = ViolationDetectionService.detect_pattern_violations(db, now=start_time)
         
         total_detected = (
             attendance_result["detected_count"] + 
@@ -1,19 +1,40 @@
 from fastapi import FastAPI, Depends, HTTPException, Request, status, Query, Form, Body
 from fastapi.security import HTTPBearer
 from fastapi.templating import Jinja2Templates
+from jinja2 import TemplateNotFound
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import selectinload, joinedload, raiseload, aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import or_, and_, select, func, case, delete, exists, update, bindparam, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timedelta
+from cachetools import TTLCache
+from contextlib import asynccontextmanager, suppress
+import asyncio
+import hashlib
+import httpx
+import orjson
+import sys
 import uvicorn
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
-# 로깅 설정
+# 로깅 설정 (실제 출력은 QueueListener 스레드가 처리하여 이벤트 루프가 로그 I/O로 막히지 않음)
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)  # 시작 시 이벤트 루프 확인 로그(INFO)가 출력되도록
+log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(log_queue))
+logger.propagate = False
+log_listener = QueueListener(log_queue, logging.StreamHandler())
 
 # 앱 모듈 import
-from app.models.database import get_db, User, Employee, AttendanceRecord, LocationEvent, JobPost, JobApplication, PaymentLog, Department, Violation
+from app.models.database import get_async_db, async_engine, AsyncSessionLocal, User, Employee, AttendanceRecord, LocationEvent, JobPost, JobApplication, PaymentLog, Department, Violation
 from app.auth import verify_token, create_access_token, require_admin, require_manager_or_admin
 from app.services.location_service import LocationService
 from app.services.job_service import JobBoardService
@@ -21,20 +42,71 @@ from app.services.payment_service import PaymentManager
 from app.services.geocoding_service import GeocodingService
 from app.services.report_service import ReportService
 from app.services.violation_detection_service import ViolationDetectionService
-from pydantic import BaseModel
-from typing import Optional, List
-from fastapi.responses import StreamingResponse
-import io
+from pydantic import BaseModel, ConfigDict, Field, AliasPath
+from typing import Optional, List, Dict, Tuple
+from fastapi.responses import StreamingResponse, ORJSONResponse, Response
 from datetime import date
+from payment.naver_pay import API_BASE as NAVER_PAY_API_BASE
 from payment.routes_payment import router as naver_pay_router
 from payment.routes_payment_return import router as naver_pay_return_router
 from payment.routes_work import router as work_router
 
+# 시작 시 외부 API 연결 준비(warm-up) 대기 시간 (초)
+HTTP_WARMUP_TIMEOUT_SECONDS = 3
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 실행"""
+    log_listener.start()
+    loop_class = type(asyncio.get_running_loop())
+    logger.info(f"Event loop: {loop_class.__module__}.{loop_class.__name__}")
+    
+    # 외부 API(네이버페이 등) 호출용 HTTP 클라이언트를 한 번만 만들어 keep-alive 연결 재사용
+    # (HTTP/2로 승인/취소 요청을 한 연결에 다중화)
+    app.state.http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=15,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60)
+    )
+    
+    # 첫 결제 요청이 TLS 핸드셰이크 지연을 겪지 않도록 네이버페이 API 연결을 미리 맺어 둠
+    try:
+        await app.state.http_client.head(NAVER_PAY_API_BASE, timeout=HTTP_WARMUP_TIMEOUT_SECONDS)
+    except httpx.HTTPError as e:
+        logger.warning(f"네이버페이 API 연결 준비 실패: {e}")
+    
+    # 요청마다 새로 만들지 않도록 결제 관리 서비스는 한 번만 생성 (HTTP 클라이언트 공유)
+    app.state.payment_manager = PaymentManager(app.state.http_client)
+    
+    # 레거시 위치 추적 이벤트를 모아서 처리하는 백그라운드 작업
+    app.state.location_queue = asyncio.Queue()
+    location_flusher = asyncio.create_task(flush_location_events(app.state.location_queue))
+    
+    # 변수 없는 페이지 템플릿은 시작 시 한 번만 렌더링
+    for name in STATIC_PAGE_TEMPLATES:
+        try:
+            get_static_page(name)
+        except TemplateNotFound:
+            logger.warning(f"Template {name} not found")
+    yield
+    location_flusher.cancel()
+    with suppress(asyncio.CancelledError):
+        await location_flusher
+    await app.state.http_client.aclose()
+    await async_engine.dispose()
+    log_listener.stop()
+
+def get_payment_manager(request: Request) -> PaymentManager:
+    """앱 시작 시 생성된 결제 관리 서비스 반환"""
+    return request.app.state.payment_manager
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="HRMS - Human Resource Management System",
     description="전문적인 인력관리 및 근태관리 시스템",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,  # orjson으로 JSON 직렬화
+    lifespan=lifespan
 )
 
 app.include_router(naver_pay_router)
@@ -42,10 +114,17 @@ app.include_router(naver_pay_return_router)
 app.include_router(work_router)
 
 # Pydantic 모델 정의
+# 요청 모델 공통 설정: 알 수 없는 필드는 무시하고 문자열 앞뒤 공백 제거
+REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", str_strip_whitespace=True)
+# 비밀번호가 포함된 모델은 공백도 비밀번호의 일부이므로 제거하지 않음
+CREDENTIAL_MODEL_CONFIG = ConfigDict(extra="ignore")
+
 class AddressToCoordinatesRequest(BaseModel):
     address: str
 
 class RegisterRequest(BaseModel):
+    model_config = CREDENTIAL_MODEL_CONFIG
+    
     username: str
     email: str
     full_name: str
@@ -63,20 +142,50 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 1KB 이상 응답은 gzip 압축 (관리자 목록 JSON 등)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # 템플릿 및 정적 파일 설정
 templates = Jinja2Templates(directory="templates")
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# 요청 정보 없이 렌더링 가능한 페이지 템플릿 (렌더링 결과를 메모리에 캐시)
+STATIC_PAGE_TEMPLATES = (
+    "login.html", "register.html", "admin_dashboard.html", "employee_mobile.html",
+    "job_board.html", "my_applications.html", "payment_complete.html"
+)
+STATIC_PAGE_MAX_AGE_SECONDS = 300
+static_pages = {}
+
+def get_static_page(name: str):
+    """렌더링된 페이지 HTML과 ETag 반환 (최초 1회만 렌더링)"""
+    page = static_pages.get(name)
+    if page is None:
+        html = templates.get_template(name).render().encode("utf-8")
+        page = static_pages[name] = (html, f'"{hashlib.blake2b(html, digest_size=16).hexdigest()}"')
+    return page
+
+def static_page_response(request: Request, name: str) -> Response:
+    """캐시된 페이지 응답 (If-None-Match가 일치하면 304)"""
+    html, etag = get_static_page(name)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={STATIC_PAGE_MAX_AGE_SECONDS}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(html, media_type="text/html", headers=headers)
+
 security = HTTPBearer()
 
 # Pydantic 모델들
 class LoginRequest(BaseModel):
+    model_config = CREDENTIAL_MODEL_CONFIG
+    
     username: str
     password: str
     role: str = "employee"
 
 class LocationRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     latitude: float
     longitude: float
     accuracy: Optional[float] = None
@@ -84,11 +193,15 @@ class LocationRequest(BaseModel):
     speed: Optional[float] = None
 
 class AttendanceAction(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     latitude: float
     longitude: float
     accuracy: Optional[float] = None
 
 class JobPostCreate(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     title: str
     company_name: str
     description: str
@@ -113,6 +226,8 @@ class PaymentCallback(BaseModel):
     status: str
 
 class PaymentCreateRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     application_id: int
 
 class TestRequest(BaseModel):
@@ -120,9 +235,58 @@ class TestRequest(BaseModel):
     message: str
 
 class DepartmentCreateRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     name: str
     description: str = ""
 
+class ViolationBatchReviewRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
+    violation_ids: List[int]
+    action: str  # acknowledge, resolve, dismiss
+    notes: Optional[str] = None
+
+# 응답 모델 공통 설정: ORM 객체 속성에서 바로 읽어 직렬화
+RESPONSE_MODEL_CONFIG = ConfigDict(from_attributes=True)
+
+class AttendanceRecordOut(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    id: int
+    check_in_time: Optional[datetime] = None
+    check_out_time: Optional[datetime] = None
+    total_work_minutes: Optional[int] = None
+    is_late: Optional[bool] = None
+    status: Optional[str] = None
+    site_name: Optional[str] = Field(None, validation_alias=AliasPath("site", "name"))
+    check_in_location: Optional[str] = None
+    check_out_location: Optional[str] = None
+
+class AttendanceStatisticsOut(BaseModel):
+    total_days: int
+    total_hours: float
+    late_count: int
+    avg_hours: float
+
+class AttendanceHistoryOut(BaseModel):
+    records: List[AttendanceRecordOut]
+    statistics: AttendanceStatisticsOut
+    next_cursor: Optional[str] = None
+
+# 자주 쓰는 신청 조회 구문 (모듈 로드 시 한 번만 구성하고 값은 실행 시 바인딩)
+APPLICATION_BY_ID_STMT = select(JobApplication).where(JobApplication.id == bindparam("application_id"))
+APPLICATION_BY_ID_USER_STMT = APPLICATION_BY_ID_STMT.where(JobApplication.user_id == bindparam("user_id"))
+APPLICATION_BY_ID_FOR_UPDATE_STMT = APPLICATION_BY_ID_STMT.with_for_update()
+
+# 부서 목록 응답 캐시 (부서/직원이 추가·변경·삭제되면 무효화)
+DEPARTMENTS_CACHE_TTL_SECONDS = 300
+departments_cache = TTLCache(maxsize=8, ttl=DEPARTMENTS_CACHE_TTL_SECONDS)
+
+def invalidate_departments_cache():
+    """부서 목록 캐시 비우기"""
+    departments_cache.clear()
+
 # PWA 지원
 @app.get("/static/sw.js")
 def service_worker():
@@ -131,75 +295,70 @@ def service_worker():
     return FileResponse("static/sw.js", media_type="application/javascript")
 
 # 웹 페이지 라우트들
-@app.get("/")
+@app.api_route("/", methods=["GET", "HEAD"])
 def index(request: Request):
     """메인 페이지"""
-    return templates.TemplateResponse("login.html", {"request": request})
+    return static_page_response(request, "login.html")
 
-@app.get("/register")
+@app.api_route("/register", methods=["GET", "HEAD"])
 def register_page(request: Request):
     """회원가입 페이지"""
-    return templates.TemplateResponse("register.html", {"request": request})
-
-@app.get("/")
-def home(request: Request):
-    """홈페이지"""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return static_page_response(request, "register.html")
 
-@app.get("/login")
+@app.api_route("/login", methods=["GET", "HEAD"])
 def login_page(request: Request):
     """로그인 페이지"""
-    return templates.TemplateResponse("login.html", {"request": request})
+    return static_page_response(request, "login.html")
 
-@app.get("/admin")
+@app.api_route("/admin", methods=["GET", "HEAD"])
 def admin_dashboard(request: Request):
     """관리자 대시보드"""
-    return templates.TemplateResponse("admin_dashboard.html", {"request": request})
+    return static_page_response(request, "admin_dashboard.html")
 
-@app.get("/employee")
+@app.api_route("/employee", methods=["GET", "HEAD"])
 def employee_mobile(request: Request):
     """직원용 모바일 인터페이스"""
-    return templates.TemplateResponse("employee_mobile.html", {"request": request})
+    return static_page_response(request, "employee_mobile.html")
 
-@app.get("/employee/history")
+@app.api_route("/employee/history", methods=["GET", "HEAD"])
 def employee_history(request: Request):
     """직원 출입 기록 페이지"""
-    return templates.TemplateResponse("employee_history.html", {"request": request})
+    return static_page_response(request, "employee_history.html")
 
-@app.get("/jobs")
+@app.api_route("/jobs", methods=["GET", "HEAD"])
 def job_board(request: Request):
     """채용 게시판"""
-    return templates.TemplateResponse("job_board.html", {"request": request})
+    return static_page_response(request, "job_board.html")
 
 @app.get("/jobs/{job_id}")
 def job_detail(request: Request, job_id: int):
     """채용 공고 상세 페이지"""
     return templates.TemplateResponse("job_detail.html", {"request": request, "job_id": job_id})
 
-@app.get("/api-test")
+@app.api_route("/api-test", methods=["GET", "HEAD"])
 def api_test_page(request: Request):
     """디버깅용 API 테스트 페이지"""
-    return templates.TemplateResponse("api_test.html", {"request": request})
+    return static_page_response(request, "api_test.html")
 
-@app.get("/my-applications")
+@app.api_route("/my-applications", methods=["GET", "HEAD"])
 def my_applications(request: Request):
     """나의 신청 목록"""
-    return templates.TemplateResponse("my_applications.html", {"request": request})
+    return static_page_response(request, "my_applications.html")
 
-@app.get("/payment/complete")
+@app.api_route("/payment/complete", methods=["GET", "HEAD"])
 def payment_complete(request: Request):
     """보증금 결제 완료 페이지"""
-    return templates.TemplateResponse("payment_complete.html", {"request": request})
+    return static_page_response(request, "payment_complete.html")
 
 @app.post("/api/payment/start/{application_id}")
-def start_payment(application_id: int, current_user: dict = Depends(verify_token), db: Session = Depends(get_db)):
+async def start_payment(application_id: int, current_user: dict = Depends(verify_token), db: AsyncSession = Depends(get_async_db)):
     """보증금 결제 시작"""
     try:
         # 신청 정보 확인
-        application = db.query(JobApplication).filter(
-            JobApplication.id == application_id,
-            JobApplication.user_id == current_user["user_id"]
-        ).first()
+        application = await db.scalar(
+            APPLICATION_BY_ID_USER_STMT,
+            {"application_id": application_id, "user_id": current_user["user_id"]}
+        )
         
         if not application:
             raise HTTPException(status_code=404, detail="신청 정보를 찾을 수 없습니다")
@@ -229,14 +388,14 @@ def start_payment(application_id: int, current_user: dict = Depends(verify_token
         raise HTTPException(status_code=500, detail=f"결제 시작 중 오류가 발생했습니다: {str(e)}")
 
 @app.post("/api/payment/complete/{application_id}")
-def complete_payment(application_id: int, payment_data: dict = Body(...), current_user: dict = Depends(verify_token), db: Session = Depends(get_db)):
+async def complete_payment(application_id: int, payment_data: dict = Body(...), current_user: dict = Depends(verify_token), db: AsyncSession = Depends(get_async_db)):
     """보증금 결제 완료 처리"""
     try:
         # 신청 정보 확인
-        application = db.query(JobApplication).filter(
-            JobApplication.id == application_id,
-            JobApplication.user_id == current_user["user_id"]
-        ).first()
+        application = await db.scalar(
+            APPLICATION_BY_ID_USER_STMT,
+            {"application_id": application_id, "user_id": current_user["user_id"]}
+        )
         
         if not application:
             raise HTTPException(status_code=404, detail="신청 정보를 찾을 수 없습니다")
@@ -263,7 +422,7 @@ def complete_payment(application_id: int, payment_data: dict = Body(...), curren
                 created_at=datetime.now()
             )
             db.add(payment_log)
-            db.commit()
+            await db.commit()
             
             return {"success": True, "message": "보증금 결제가 완료되었습니다"}
         else:
@@ -276,17 +435,17 @@ def complete_payment(application_id: int, payment_data: dict = Body(...), curren
 
 # 인증 API
 @app.post("/api/auth/register")
-async def register(register_data: RegisterRequest, db: Session = Depends(get_db)):
+async def register(register_data: RegisterRequest, db: AsyncSession = Depends(get_async_db)):
     """회원가입"""
     from app.models.database import get_password_hash
     import uuid
     from datetime import datetime
     
     # 중복 확인
-    existing_user = db.query(User).filter(
+    existing_user = await db.scalar(select(User).where(
         (User.username == register_data.username) | 
         (User.email == register_data.email)
-    ).first()
+    ))
     
     if existing_user:
         if existing_user.username == register_data.username:
@@ -301,19 +460,22 @@ async def register(register_data: RegisterRequest, db: Session = Depends(get_db)
             )
     
     try:
+        # bcrypt 해싱은 CPU 작업이므로 스레드풀에서 실행 (이벤트 루프 블로킹 방지)
+        hashed_password = await run_in_threadpool(get_password_hash, register_data.password)
+        
         # 새 사용자 생성
         new_user = User(
             username=register_data.username,
             email=register_data.email,
             full_name=register_data.full_name,
-            hashed_password=get_password_hash(register_data.password),
+            hashed_password=hashed_password,
             role="employee",
             is_active=True
         )
         
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        await db.refresh(new_user)
         
         # 직원번호 생성 (제공되지 않은 경우)
         employee_number = register_data.employee_number
@@ -323,7 +485,7 @@ async def register(register_data: RegisterRequest, db: Session = Depends(get_db)
         # 부서 ID 찾기
         department_id = None
         if register_data.department:
-            department = db.query(Department).filter(Department.name == register_data.department).first()
+            department = await db.scalar(select(Department).where(Department.name == register_data.department))
             if department:
                 department_id = department.id
         
@@ -340,7 +502,8 @@ async def register(register_data: RegisterRequest, db: Session = Depends(get_db)
         )
         
         db.add(new_employee)
-        db.commit()
+        await db.commit()
+        invalidate_departments_cache()
         
         return {
             "message": "회원가입이 완료되었습니다.",
@@ -349,20 +512,21 @@ async def register(register_data: RegisterRequest, db: Session = Depends(get_db)
         }
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"회원가입 처리 중 오류가 발생했습니다: {str(e)}"
         )
 
 @app.post("/api/auth/login")
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
     """로그인"""
     from app.models.database import verify_password
     
-    user = db.query(User).filter(User.username == login_data.username).first()
+    user = await db.scalar(select(User).where(User.username == login_data.username))
     
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    # bcrypt 검증은 CPU 작업이므로 스레드풀에서 실행
+    if not user or not await run_in_threadpool(verify_password, login_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="사용자명 또는 비밀번호가 올바르지 않습니다."
@@ -383,7 +547,7 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
     
     # 마지막 로그인 시간 업데이트
     user.last_login = datetime.now()
-    db.commit()
+    await db.commit()
     
     # 토큰 생성
     access_token = create_access_token(data={"sub": user.username})
@@ -422,7 +586,7 @@ def employee_detail_page(request: Request, employee_id: int):
 async def get_employee_detail(
     employee_id: int,
     current_user: User = Depends(require_manager_or_admin), # 관리자 또는 매니저 권한 필요
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     직원 상세 정보 조회 API 엔드포인트
@@ -430,7 +594,7 @@ async def get_employee_detail(
     Args:
         employee_id (int): 상세 정보를 조회할 직원의 ID.
         current_user (User): 인증된 현재 사용자 객체 (require_manager_or_admin 의존성 주입).
-        db (Session): 데이터베이스 세션 객체 (get_db 의존성 주입).
+        db (AsyncSession): 비동기 데이터베이스 세션 객체 (get_async_db 의존성 주입).
 
     Returns:
         dict: 직원의 상세 정보, 통계, 최근 출근 기록 및 위치 이벤트 목록.
@@ -440,39 +604,53 @@ async def get_employee_detail(
     """
     # 1. 직원 정보 조회: 주어진 employee_id로 직원 엔티티를 찾습니다.
     #    직원이 존재하지 않으면 404 Not Found 오류를 발생시킵니다.
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    #    사용자와 부서 정보는 같은 쿼리에서 JOIN으로 함께 로드합니다.
+    employee = await db.scalar(
+        select(Employee).options(
+            joinedload(Employee.user),
+            joinedload(Employee.department),
+            raiseload("*")
+        ).where(Employee.id == employee_id)
+    )
     if not employee:
         raise HTTPException(status_code=404, detail="직원을 찾을 수 없습니다.")
     
-    # 2. 사용자 정보 조회: 직원과 연결된 사용자 엔티티를 찾습니다.
-    user = db.query(User).filter(User.id == employee.user_id).first()
+    # 2. 사용자 정보: 직원과 연결된 사용자 엔티티 (1단계에서 함께 로드됨)
+    user = employee.user
     
-    # 3. 최근 출근 기록 조회: 해당 직원의 최신 출근 기록 10개를 가져옵니다.
-    recent_attendance = db.query(AttendanceRecord).filter(
-        AttendanceRecord.employee_id == employee_id
-    ).order_by(AttendanceRecord.check_in_time.desc()).limit(10).all()
+    # 3. 최근 출근 기록 조회: 해당 직원의 최신 출근 기록 10개를 근무지와 함께 가져옵니다.
+    recent_attendance = (await db.scalars(
+        select(AttendanceRecord).options(selectinload(AttendanceRecord.site), raiseload("*")).where(
+            AttendanceRecord.employee_id == employee_id
+        ).order_by(AttendanceRecord.check_in_time.desc()).limit(10)
+    )).all()
     
-    # 4. 최근 위치 이벤트 조회: 해당 직원의 최신 위치 이벤트 20개를 가져옵니다.
-    recent_locations = db.query(LocationEvent).filter(
-        LocationEvent.employee_id == employee_id
-    ).order_by(LocationEvent.timestamp.desc()).limit(20).all()
+    # 4. 최근 위치 이벤트 조회: 해당 직원의 최신 위치 이벤트 20개를 근무지와 함께 가져옵니다.
+    recent_locations = (await db.scalars(
+        select(LocationEvent).options(selectinload(LocationEvent.site), raiseload("*")).where(
+            LocationEvent.employee_id == employee_id
+        ).order_by(LocationEvent.timestamp.desc()).limit(20)
+    )).all()
     
     # 5. 월별 통계 계산: 현재 월의 출근 기록을 기반으로 통계를 계산합니다.
     today = datetime.now().date()
     this_month_start = datetime(today.year, today.month, 1) # 현재 월의 첫째 날
     
-    this_month_attendance = db.query(AttendanceRecord).filter(
-        AttendanceRecord.employee_id == employee_id,
-        AttendanceRecord.check_in_time >= this_month_start # 현재 월의 출근 기록 필터링
-    ).all()
-    
-    # 근무 완료된 일수 계산 (퇴근 시간이 있는 기록만 카운트)
-    total_work_days = len([r for r in this_month_attendance if r.check_out_time])
-    # 총 근무 시간 계산 (분 단위 합계를 시간으로 변환)
-    total_work_minutes_sum = sum([r.total_work_minutes for r in this_month_attendance if r.total_work_minutes is not None])
-    total_work_hours = total_work_minutes_sum / 60
-    # 지각 횟수 계산
-    late_count = len([r for r in this_month_attendance if r.is_late])
+    #    기록을 가져오지 않고 SQL 집계 함수로 한 번에 계산합니다.
+    total_work_days, total_work_minutes_sum, late_count = (await db.execute(
+        select(
+            # 근무 완료된 일수 (퇴근 시간이 있는 기록만 카운트)
+            func.count().filter(AttendanceRecord.check_out_time.isnot(None)),
+            # 총 근무 시간 (분 단위 합계)
+            func.coalesce(func.sum(AttendanceRecord.total_work_minutes), 0),
+            # 지각 횟수
+            func.count().filter(AttendanceRecord.is_late == True)
+        ).where(
+            AttendanceRecord.employee_id == employee_id,
+            AttendanceRecord.check_in_time >= this_month_start # 현재 월의 출근 기록 필터링
+        )
+    )).one()
+    total_work_hours = total_work_minutes_sum / 60 # 분 단위 합계를 시간으로 변환
     
     # 6. 결과 반환: 직원의 기본 정보, 계산된 통계, 그리고 최근 활동 목록을 구조화하여 반환합니다.
     return {
@@ -519,74 +697,87 @@ async def get_employee_detail(
 @app.get("/api/admin/departments")
 async def get_departments(
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """부서 목록 조회"""
+    cached = departments_cache.get("admin")
+    if cached is not None:
+        return cached
+    
     try:
-        departments = db.query(Department).all()
-        return [
+        # 부서별 직원 수는 GROUP BY 서브쿼리로 함께 조회
+        employee_counts = select(
+            Employee.department_id,
+            func.count(Employee.id).label("employee_count")
+        ).group_by(Employee.department_id).subquery()
+        
+        rows = (await db.execute(
+            select(Department, func.coalesce(employee_counts.c.employee_count, 0))
+            .outerjoin(employee_counts, employee_counts.c.department_id == Department.id)
+            .order_by(Department.id)
+        )).all()
+        result = [
             {
                 "id": dept.id,
                 "name": dept.name,
                 "description": dept.description,
-                "employee_count": len(dept.employees) if dept.employees else 0
-            } for dept in departments
+                "employee_count": employee_count
+            } for dept, employee_count in rows
         ]
-    except Exception as e:
-        print(f"Departments API error: {e}")
+        departments_cache["admin"] = result
+        return result
+    except Exception:
+        logger.exception("Departments API error")
         return []
 
 # 부서 목록 API (회원가입용 - 인증 불필요)
 @app.get("/api/departments")
-async def get_public_departments(db: Session = Depends(get_db)):
+async def get_public_departments(db: AsyncSession = Depends(get_async_db)):
     """회원가입용 부서 목록 조회 (인증 불필요)"""
+    cached = departments_cache.get("public")
+    if cached is not None:
+        return cached
+    
     try:
-        departments = db.query(Department).all()
-        return [
+        rows = (await db.execute(select(Department.id, Department.name).order_by(Department.id))).all()
+        result = [
             {
-                "id": dept.id,
-                "name": dept.name
-            } for dept in departments
+                "id": dept_id,
+                "name": name
+            } for dept_id, name in rows
         ]
-    except Exception as e:
-        print(f"Public departments API error: {e}")
+        departments_cache["public"] = result
+        return result
+    except Exception:
+        logger.exception("Public departments API error")
         return []
 
 @app.post("/api/admin/departments")
 async def create_department(
     department_data: DepartmentCreateRequest,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """부서 생성"""
     try:
-        # 기본 회사 확인 및 생성
+        # 기본 회사가 없으면 생성 (이미 있으면 무시)
         from app.models.database import Company
-        default_company = db.query(Company).filter(Company.id == 1).first()
-        if not default_company:
-            default_company = Company(
-                id=1,
-                name="기본 회사",
-                business_number="000-00-00000",
-                address="기본 주소"
-            )
-            db.add(default_company)
-            db.flush()
-        
-        # 중복 확인
-        existing_dept = db.query(Department).filter(Department.name == department_data.name).first()
-        if existing_dept:
-            raise HTTPException(status_code=400, detail="이미 존재하는 부서명입니다.")
+        insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+        await db.execute(
+            insert(Company)
+            .values(id=1, name="기본 회사", business_number="000-00-00000", address="기본 주소")
+            .on_conflict_do_nothing(index_elements=["id"])
+        )
         
-        # 부서 생성
+        # 부서 생성 (부서명 중복은 unique 인덱스로 확인)
         department = Department(
             name=department_data.name,
             description=department_data.description,
             company_id=1  # 기본 회사 ID
         )
         db.add(department)
-        db.commit()
-        db.refresh(department)
+        await db.commit()
+        invalidate_departments_cache()
         
         return {
             "success": True,
@@ -598,25 +789,34 @@ async def create_department(
             }
         }
         
+    except IntegrityError as e:
+        await db.rollback()
+        # 부서명 유니크 인덱스 위반만 중복 부서명으로 안내 (회사 사업자번호 등 다른 제약 위반은 서버 오류)
+        message = str(e.orig)
+        if "uq_department_name" in message or "departments.name" in message:
+            raise HTTPException(status_code=400, detail="이미 존재하는 부서명입니다.")
+        raise HTTPException(status_code=500, detail=f"부서 생성 중 오류가 발생했습니다: {message}")
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"부서 생성 중 오류가 발생했습니다: {str(e)}")
 
 @app.delete("/api/admin/departments/{department_id}")
 async def delete_department(
     department_id: int,
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """부서 삭제"""
     try:
         # 부서 존재 확인
-        department = db.query(Department).filter(Department.id == department_id).first()
+        department = await db.scalar(select(Department).where(Department.id == department_id))
         if not department:
             raise HTTPException(status_code=404, detail="존재하지 않는 부서입니다.")
         
         # 부서에 속한 직원 확인
-        employee_count = db.query(Employee).filter(Employee.department_id == department_id).count()
+        employee_count = await db.scalar(
+            select(func.count()).select_from(Employee).where(Employee.department_id == department_id)
+        )
         if employee_count > 0:
             raise HTTPException(
                 status_code=400, 
@@ -624,8 +824,9 @@ async def delete_department(
             )
         
         # 부서 삭제
-        db.delete(department)
-        db.commit()
+        await db.delete(department)
+        await db.commit()
+        invalidate_departments_cache()
         
         return {
             "success": True,
@@ -635,7 +836,7 @@ async def delete_department(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error deleting department {department_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"부서 삭제 중 오류가 발생했습니다: {str(e)}")
 
@@ -643,30 +844,31 @@ async def delete_department(
 @app.post("/api/test/request")
 async def test_request(test_data: TestRequest):
     """Test endpoint"""
-    return {"success": True, "received": test_data.dict()}
+    return {"success": True, "received": test_data.model_dump(mode="json")}
 
 # Test endpoint with dependencies like the payment endpoint
 @app.post("/api/test/with-deps")
 async def test_request_with_deps(
     test_data: TestRequest,
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Test endpoint with dependencies"""
-    return {"success": True, "received": test_data.dict(), "user": current_user.username}
+    return {"success": True, "received": test_data.model_dump(mode="json"), "user": current_user.username}
 
 # 실제 결제 기능을 위한 네이버페이 결제 API
 @app.post("/api/payment/naver/create-new")
 async def create_naver_payment(
     payment_data: PaymentCreateRequest,
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    payment_manager: PaymentManager = Depends(get_payment_manager)
 ):
     """네이버페이 결제 생성"""
-    application = db.query(JobApplication).filter(
+    application = await db.scalar(select(JobApplication).where(
         JobApplication.id == payment_data.application_id,
         JobApplication.user_id == current_user.id
-    ).first()
+    ))
     
     if not application:
         raise HTTPException(status_code=404, detail="신청 정보를 찾을 수 없습니다.")
@@ -674,8 +876,7 @@ async def create_naver_payment(
     if application.deposit_paid:
         raise HTTPException(status_code=400, detail="이미 결제된 신청입니다.")
     
-    payment_manager = PaymentManager()
-    result = payment_manager.initiate_deposit_payment(
+    result = await payment_manager.initiate_deposit_payment(
         payment_data.application_id,
         current_user.full_name,
         db
@@ -691,67 +892,93 @@ async def create_naver_payment(
         raise HTTPException(status_code=400, detail=result["error"])
 
 # 관리자 대시보드 실제 데이터 로드 API들
-@app.get("/api/admin/attendance-records")
-async def get_attendance_records(
-    date: Optional[str] = None,
-    department_id: Optional[int] = None,
-    current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
-):
-    """출근 기록 조회"""
-    query = db.query(AttendanceRecord)
+ATTENDANCE_EXPORT_BATCH_SIZE = 500
+
+def _attendance_records_query(date: Optional[str], department_id: Optional[int]):
+    """출근 기록 조회 쿼리 (직원 이름/사업장 이름을 JOIN하여 필요한 컬럼만 조회)"""
+    from app.models.database import Site
+    
+    query = select(
+        User.full_name.label("employee_name"),
+        AttendanceRecord.check_in_time,
+        AttendanceRecord.check_out_time,
+        AttendanceRecord.total_work_minutes,
+        AttendanceRecord.is_late,
+        Site.name.label("site_name"),
+        AttendanceRecord.status
+    ).join(
+        Employee, Employee.id == AttendanceRecord.employee_id
+    ).join(
+        User, User.id == Employee.user_id
+    ).outerjoin(
+        Site, Site.id == AttendanceRecord.site_id
+    )
     
     # 날짜 필터
     if date:
-        target_date = datetime.strptime(date, "%Y-%m-%d").date()
-        start_datetime = datetime.combine(target_date, datetime.min.time())
-        end_datetime = datetime.combine(target_date + timedelta(days=1), datetime.min.time())
-        query = query.filter(
+        start_datetime = datetime.strptime(date, "%Y-%m-%d")
+        end_datetime = start_datetime + timedelta(days=1)
+        query = query.where(
             AttendanceRecord.check_in_time >= start_datetime,
             AttendanceRecord.check_in_time < end_datetime
         )
     
     # 부서 필터
     if department_id:
-        query = query.join(Employee).filter(Employee.department_id == department_id)
+        query = query.where(Employee.department_id == department_id)
+    
+    return query.order_by(AttendanceRecord.check_in_time.desc())
+
+@app.get("/api/admin/attendance-records")
+async def get_attendance_records(
+    date: Optional[str] = None,
+    department_id: Optional[int] = None,
+    current_user: User = Depends(require_manager_or_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """출근 기록 조회"""
+    rows = (await db.execute(_attendance_records_query(date, department_id).limit(100))).mappings().all()
     
-    records = query.order_by(AttendanceRecord.check_in_time.desc()).limit(100).all()
+    return ORJSONResponse(content=[dict(row) for row in rows])
+
+@app.get("/api/admin/attendance-records/export")
+async def export_attendance_records(
+    date: Optional[str] = None,
+    department_id: Optional[int] = None,
+    current_user: User = Depends(require_manager_or_admin)
+):
+    """출근 기록 전체 내보내기 (ND-JSON 스트리밍)"""
+    query = _attendance_records_query(date, department_id).execution_options(yield_per=ATTENDANCE_EXPORT_BATCH_SIZE)
     
-    from app.models.database import Site
-    result = []
-    for record in records:
-        employee = db.query(Employee).filter(Employee.id == record.employee_id).first()
-        user = db.query(User).filter(User.id == employee.user_id).first()
-        site = db.query(Site).filter(Site.id == record.site_id).first() if record.site_id else None
-        
-        result.append({
-            "employee_name": user.full_name,
-            "check_in_time": record.check_in_time,
-            "check_out_time": record.check_out_time,
-            "total_work_minutes": record.total_work_minutes,
-            "is_late": record.is_late,
-            "site_name": site.name if site else None,
-            "status": record.status
-        })
+    async def generate():
+        # 응답을 보내는 동안 사용할 세션은 스트림 안에서 직접 열고 닫음
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(query)
+            async for row in result.mappings():
+                yield orjson.dumps(dict(row)) + b"\n"
     
-    return result
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 @app.get("/api/admin/violations")
 async def get_violations(
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """위반 사항 조회"""
-    violations = db.query(Violation).order_by(Violation.occurred_at.desc()).limit(50).all()
+    # 직원 이름은 JOIN으로 함께 조회
+    rows = (await db.execute(
+        select(Violation, User.full_name)
+        .join(Employee, Employee.id == Violation.employee_id)
+        .join(User, User.id == Employee.user_id)
+        .order_by(Violation.occurred_at.desc())
+        .limit(50)
+    )).all()
     
     result = []
-    for violation in violations:
-        employee = db.query(Employee).filter(Employee.id == violation.employee_id).first()
-        user = db.query(User).filter(User.id == employee.user_id).first()
-        
+    for violation, employee_name in rows:
         result.append({
             "id": violation.id,
-            "employee_name": user.full_name,
+            "employee_name": employee_name,
             "violation_type": violation.violation_type,
             "severity": violation.severity,
             "occurred_at": violation.occurred_at,
@@ -759,65 +986,91 @@ async def get_violations(
             "status": violation.status
         })
     
-    return result
+    return ORJSONResponse(content=result)
 
 
 @app.get("/api/admin/stats")
 async def get_admin_stats(
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """관리자 대시보드 통계"""
-    today = datetime.now().date()
-    
-    # 전체 직원 수
-    total_employees = db.query(Employee).count()
-    
-    # 오늘 출근한 직원 수
-    present_today = db.query(AttendanceRecord).filter(
-        AttendanceRecord.check_in_time >= datetime.combine(today, datetime.min.time()),
-        AttendanceRecord.check_in_time < datetime.combine(today + timedelta(days=1), datetime.min.time())
-    ).count()
-    
-    # 오늘 지각한 직원 수
-    late_today = db.query(AttendanceRecord).filter(
-        AttendanceRecord.check_in_time >= datetime.combine(today, datetime.min.time()),
-        AttendanceRecord.is_late == True
-    ).count()
+    start_dt = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    end_dt = start_dt + timedelta(days=1)
+    
+    # 전체 직원 수 / 오늘 출근한 직원 수 / 오늘 지각한 직원 수 (한 번의 쿼리)
+    total_employees, present_today, late_today = (await db.execute(
+        select(
+            select(func.count()).select_from(Employee).scalar_subquery(),
+            func.count().filter(AttendanceRecord.check_in_time < end_dt),
+            func.count().filter(AttendanceRecord.is_late == True)
+        ).where(
+            AttendanceRecord.check_in_time >= start_dt
+        )
+    )).one()
     
     # 오늘 결근한 직원 수 (예정되어 있었지만 출근하지 않은 직원)
     absent_today = total_employees - present_today
     
-    return {
+    return ORJSONResponse(content={
         "total_employees": total_employees,
         "present_today": present_today,
         "late_today": late_today,
         "absent_today": max(0, absent_today)
-    }
+    })
+
+def _latest_location_per_employee():
+    """직원별 가장 최근 위치 이벤트 (ROW_NUMBER 윈도우 함수, rn == 1이 최신)"""
+    ranked = select(
+        LocationEvent,
+        func.row_number().over(
+            partition_by=LocationEvent.employee_id,
+            order_by=(LocationEvent.timestamp.desc(), LocationEvent.id.desc())
+        ).label("rn")
+    ).subquery()
+    return aliased(LocationEvent, ranked), ranked.c.rn
+
+def _first_attendance_per_employee(since: datetime):
+    """직원별 since 이후 첫 출근 기록 (ROW_NUMBER 윈도우 함수, rn == 1이 첫 기록)"""
+    ranked = select(
+        AttendanceRecord,
+        func.row_number().over(
+            partition_by=AttendanceRecord.employee_id,
+            order_by=AttendanceRecord.id
+        ).label("rn")
+    ).where(AttendanceRecord.check_in_time >= since).subquery()
+    return aliased(AttendanceRecord, ranked), ranked.c.rn
 
 @app.get("/api/admin/current-status")
 async def get_current_working_status(
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """현재 근무 중인 직원 현황"""
-    today = datetime.now().date()
+    today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
     
     # 오늘 출근했지만 아직 퇴근하지 않은 직원들
-    working_records = db.query(AttendanceRecord).filter(
-        AttendanceRecord.check_in_time >= datetime.combine(today, datetime.min.time()),
-        AttendanceRecord.check_out_time.is_(None)
-    ).all()
+    #    (최근 위치도 윈도우 함수 서브쿼리를 JOIN하여 한 번에 조회)
+    LastLocation, location_rn = _latest_location_per_employee()
+    rows = (await db.execute(
+        select(AttendanceRecord, LastLocation).options(
+            joinedload(AttendanceRecord.employee).joinedload(Employee.user),
+            joinedload(AttendanceRecord.employee).joinedload(Employee.department),
+            selectinload(LastLocation.site),
+            raiseload("*")
+        ).outerjoin(
+            LastLocation,
+            and_(LastLocation.employee_id == AttendanceRecord.employee_id, location_rn == 1)
+        ).where(
+            AttendanceRecord.check_in_time >= today_start,
+            AttendanceRecord.check_out_time.is_(None)
+        ).order_by(AttendanceRecord.id)
+    )).all()
     
     working_employees = []
-    for record in working_records:
-        employee = db.query(Employee).filter(Employee.id == record.employee_id).first()
-        user = db.query(User).filter(User.id == employee.user_id).first()
-        
-        # 최근 위치 조회
-        last_location = db.query(LocationEvent).filter(
-            LocationEvent.employee_id == employee.id
-        ).order_by(LocationEvent.timestamp.desc()).first()
+    for record, last_location in rows:
+        employee = record.employee
+        user = employee.user
         
         working_employees.append({
             "employee_id": employee.id,
@@ -828,77 +1081,132 @@ async def get_current_working_status(
             "last_location_update": last_location.timestamp if last_location else None
         })
     
-    return {"working_employees": working_employees}
+    return ORJSONResponse(content={"working_employees": working_employees})
 
 @app.get("/api/admin/recent-activity")
 async def get_recent_activity(
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """최근 출입 활동"""
-    recent_events = db.query(LocationEvent).filter(
-        LocationEvent.event_type.in_(["check_in", "check_out", "geofence_enter", "geofence_exit"])
-    ).order_by(LocationEvent.timestamp.desc()).limit(20).all()
+    from app.models.database import Site
+    
+    # 직원 이름과 사업장 이름을 JOIN하여 필요한 컬럼만 한 번에 조회
+    rows = (await db.execute(
+        select(
+            LocationEvent.event_type,
+            LocationEvent.timestamp,
+            LocationEvent.latitude,
+            LocationEvent.longitude,
+            User.full_name,
+            Site.name
+        ).join(
+            Employee, Employee.id == LocationEvent.employee_id
+        ).join(
+            User, User.id == Employee.user_id
+        ).outerjoin(
+            Site, Site.id == LocationEvent.site_id
+        ).where(
+            LocationEvent.event_type.in_(["check_in", "check_out", "geofence_enter", "geofence_exit"])
+        ).order_by(LocationEvent.timestamp.desc()).limit(20)
+    )).all()
     
     activities = []
-    for event in recent_events:
-        employee = db.query(Employee).filter(Employee.id == event.employee_id).first()
-        user = db.query(User).filter(User.id == employee.user_id).first()
-        
+    for event_type, timestamp, latitude, longitude, full_name, site_name in rows:
         activities.append({
-            "employee_name": user.full_name,
-            "event_type": event.event_type,
-            "site_name": event.site.name if event.site else None,
-            "timestamp": event.timestamp,
-            "location": f"{event.latitude:.6f}, {event.longitude:.6f}"
+            "employee_name": full_name,
+            "event_type": event_type,
+            "site_name": site_name,
+            "timestamp": timestamp,
+            "location": f"{latitude:.6f}, {longitude:.6f}"
         })
     
-    return activities
+    return ORJSONResponse(content=activities)
 
 @app.get("/api/admin/employees")
 async def get_all_employees(
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """전체 직원 목록"""
-    employees = db.query(Employee).all()
-    
-    employee_list = []
-    for emp in employees:
-        user = db.query(User).filter(User.id == emp.user_id).first()
-        
-        # 현재 상태 확인
-        today = datetime.now().date()
-        today_attendance = db.query(AttendanceRecord).filter(
-            AttendanceRecord.employee_id == emp.id,
-            AttendanceRecord.check_in_time >= datetime.combine(today, datetime.min.time())
-        ).first()
-        
-        status = "waiting"
-        if today_attendance:
-            if today_attendance.check_out_time:
-                status = "completed"
-            elif today_attendance.check_in_time:
-                status = "working"
-        
-        # 최근 위치
-        last_location = db.query(LocationEvent).filter(
-            LocationEvent.employee_id == emp.id
-        ).order_by(LocationEvent.timestamp.desc()).first()
-        
-        employee_list.append({
-            "id": emp.id,
-            "employee_number": emp.employee_number,
-            "full_name": user.full_name,
-            "department": emp.department.name if emp.department else None,
-            "position": emp.position,
+    today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    from app.models.database import Site
+    
+    # 직원별 오늘 첫 출근 기록과 최근 위치를 윈도우 함수 서브쿼리로 JOIN하고,
+    # 현재 상태(waiting/working/completed)도 SQL의 CASE로 계산하여 한 번에 조회
+    TodayAttendance, attendance_rn = _first_attendance_per_employee(today_start)
+    LastLocation, location_rn = _latest_location_per_employee()
+    current_status = case(
+        (TodayAttendance.check_out_time.isnot(None), "completed"),
+        (TodayAttendance.check_in_time.isnot(None), "working"),
+        else_="waiting"
+    )
+    rows = (await db.execute(
+        select(
+            Employee.id,
+            Employee.employee_number,
+            User.full_name,
+            Department.name,
+            Employee.position,
+            current_status,
+            Site.name,
+            Employee.gps_tracking_enabled,
+            User.role
+        ).join(
+            User, User.id == Employee.user_id
+        ).outerjoin(
+            Department, Department.id == Employee.department_id
+        ).outerjoin(
+            TodayAttendance,
+            and_(TodayAttendance.employee_id == Employee.id, attendance_rn == 1)
+        ).outerjoin(
+            LastLocation,
+            and_(LastLocation.employee_id == Employee.id, location_rn == 1)
+        ).outerjoin(
+            Site, Site.id == LastLocation.site_id
+        ).order_by(Employee.id)
+    )).all()
+    
+    employee_list = [
+        {
+            "id": emp_id,
+            "employee_number": employee_number,
+            "full_name": full_name,
+            "department": department_name,
+            "position": position,
             "current_status": status,
-            "last_location": f"{last_location.site.name if last_location and last_location.site else '위치 정보 없음'}",
-            "gps_enabled": emp.gps_tracking_enabled,
-            "role": user.role  # 사용자 권한 정보 추가
-        })
+            "last_location": site_name or "위치 정보 없음",
+            "gps_enabled": gps_enabled,
+            "role": role  # 사용자 권한 정보 추가
+        }
+        for emp_id, employee_number, full_name, department_name, position, status, site_name, gps_enabled, role in rows
+    ]
+    
+    return ORJSONResponse(content=employee_list)
+
+# 사용자 권한 표시명 (변경 가능한 권한 목록 겸용)
+ROLE_NAMES = {
+    "employee": "일반 직원",
+    "manager": "매니저",
+    "admin": "관리자"
+}
+VALID_ROLES = frozenset(ROLE_NAMES)
+
+async def _load_employee_with_user(db: AsyncSession, employee_id: int, for_update: bool = False):
+    """직원과 사용자 계정을 JOIN 한 번으로 조회 (없으면 404, for_update면 직원 행을 잠금)"""
+    query = select(Employee, User).outerjoin(User, User.id == Employee.user_id).where(Employee.id == employee_id)
+    if for_update:
+        # 외부 조인의 nullable 쪽은 잠글 수 없으므로 직원 행만 FOR UPDATE
+        query = query.with_for_update(of=Employee)
+    row = (await db.execute(query)).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="직원을 찾을 수 없습니다.")
     
-    return employee_list
+    employee, user = row
+    if not user:
+        raise HTTPException(status_code=404, detail="사용자 계정을 찾을 수 없습니다.")
+    return employee, user
 
 @app.post("/api/admin/employees")
 async def create_employee(
@@ -909,29 +1217,32 @@ async def create_employee(
     department_id: int = Form(...),
     position: str = Form(...),
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """직원 추가"""
     from app.models.database import get_password_hash
     try:
         # 중복 확인
-        existing_user = db.query(User).filter(
+        user_exists = await db.scalar(select(exists().where(
             or_(User.username == username, User.email == email)
-        ).first()
+        )))
         
-        if existing_user:
+        if user_exists:
             raise HTTPException(status_code=400, detail="이미 존재하는 사용자명 또는 이메일입니다.")
         
+        # bcrypt 해싱은 CPU 작업이므로 스레드풀에서 실행
+        hashed_password = await run_in_threadpool(get_password_hash, password)
+        
         # 사용자 계정 생성
         user = User(
             username=username,
             email=email,
-            hashed_password=get_password_hash(password),
+            hashed_password=hashed_password,
             full_name=full_name,
             role="employee"
         )
         db.add(user)
-        db.flush()
+        await db.flush()
         
         # 직원 번호 생성
         employee_number = f"EMP{user.id:04d}"
@@ -947,7 +1258,8 @@ async def create_employee(
             gps_tracking_enabled=True
         )
         db.add(employee)
-        db.commit()
+        await db.commit()
+        invalidate_departments_cache()
         
         return {
             "success": True,
@@ -956,44 +1268,41 @@ async def create_employee(
         }
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"직원 추가 중 오류가 발생했습니다: {str(e)}")
 
 @app.delete("/api/admin/employees/{employee_id}")
 async def delete_employee(
     employee_id: int,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """직원 삭제"""
     try:
-        # 직원 조회
-        employee = db.query(Employee).filter(Employee.id == employee_id).first()
-        if not employee:
-            raise HTTPException(status_code=404, detail="직원을 찾을 수 없습니다.")
+        # 직원과 사용자 계정을 함께 조회 (SELECT ... FOR UPDATE로 직원 행을 잠가
+        # 삭제가 끝날 때까지 다른 요청이 관련 기록을 추가하지 못하게 함)
+        employee, user = await _load_employee_with_user(db, employee_id, for_update=True)
         
-        # 해당 직원의 사용자 계정 조회
-        user = db.query(User).filter(User.id == employee.user_id).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자 계정을 찾을 수 없습니다.")
-        
-        # 관련 데이터 삭제 (외래키 제약조건 고려)
+        # 관련 데이터 삭제 (조회부터 삭제까지 하나의 트랜잭션, 마지막에 한 번만 커밋)
+        # (외래키는 ON DELETE CASCADE이지만, SQLite는 외래키 강제가 꺼져 있고 기존 테이블에는
+        #  CASCADE 절이 없으므로 직원 단위 일괄 DELETE를 명시적으로 실행)
         # 1. 출근 기록 삭제
-        db.query(AttendanceRecord).filter(AttendanceRecord.employee_id == employee_id).delete()
+        await db.execute(delete(AttendanceRecord).where(AttendanceRecord.employee_id == employee_id))
         
         # 2. 위치 이벤트 삭제
-        db.query(LocationEvent).filter(LocationEvent.employee_id == employee_id).delete()
+        await db.execute(delete(LocationEvent).where(LocationEvent.employee_id == employee_id))
         
         # 3. 위반사항 삭제
-        db.query(Violation).filter(Violation.employee_id == employee_id).delete()
+        await db.execute(delete(Violation).where(Violation.employee_id == employee_id))
         
         # 4. 직원 삭제
-        db.delete(employee)
+        await db.delete(employee)
         
         # 5. 사용자 계정 삭제
-        db.delete(user)
+        await db.delete(user)
         
-        db.commit()
+        await db.commit()
+        invalidate_departments_cache()
         
         return {
             "success": True,
@@ -1001,7 +1310,7 @@ async def delete_employee(
         }
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"직원 삭제 중 오류가 발생했습니다: {str(e)}")
 
 @app.put("/api/admin/employees/{employee_id}/role")
@@ -1009,25 +1318,17 @@ async def change_employee_role(
     employee_id: int,
     role_data: dict,
     current_user: User = Depends(require_admin),  # 관리자만 권한 변경 가능
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """직원 권한 변경"""
     try:
-        # 직원 조회
-        employee = db.query(Employee).filter(Employee.id == employee_id).first()
-        if not employee:
-            raise HTTPException(status_code=404, detail="직원을 찾을 수 없습니다.")
-        
-        # 해당 직원의 사용자 계정 조회
-        user = db.query(User).filter(User.id == employee.user_id).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자 계정을 찾을 수 없습니다.")
+        # 직원과 사용자 계정을 함께 조회
+        employee, user = await _load_employee_with_user(db, employee_id)
         
         # 새 권한 검증
         new_role = role_data.get("role")
-        valid_roles = ["employee", "manager", "admin"]
-        if new_role not in valid_roles:
-            raise HTTPException(status_code=400, detail=f"유효하지 않은 권한입니다. 가능한 권한: {', '.join(valid_roles)}")
+        if new_role not in VALID_ROLES:
+            raise HTTPException(status_code=400, detail=f"유효하지 않은 권한입니다. 가능한 권한: {', '.join(ROLE_NAMES)}")
         
         # 자기 자신의 권한은 변경할 수 없음
         if user.id == current_user.id:
@@ -1036,21 +1337,15 @@ async def change_employee_role(
         # 권한 업데이트
         old_role = user.role
         user.role = new_role
-        db.commit()
-        
-        role_names = {
-            "employee": "일반 직원",
-            "manager": "매니저", 
-            "admin": "관리자"
-        }
+        await db.commit()
         
         return {
             "success": True,
-            "message": f"{user.full_name}님의 권한이 '{role_names[old_role]}'에서 '{role_names[new_role]}'로 변경되었습니다."
+            "message": f"{user.full_name}님의 권한이 '{ROLE_NAMES[old_role]}'에서 '{ROLE_NAMES[new_role]}'로 변경되었습니다."
         }
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"권한 변경 중 오류가 발생했습니다: {str(e)}")
 
 @app.put("/api/admin/employees/{employee_id}")
@@ -1058,27 +1353,20 @@ async def update_employee(
     employee_id: int,
     employee_data: dict,
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """직원 정보 업데이트"""
     try:
-        # 직원 존재 확인
-        employee = db.query(Employee).filter(Employee.id == employee_id).first()
-        if not employee:
-            raise HTTPException(status_code=404, detail="직원을 찾을 수 없습니다.")
-        
-        # 해당 직원의 사용자 계정 조회
-        user = db.query(User).filter(User.id == employee.user_id).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자 계정을 찾을 수 없습니다.")
+        # 직원과 사용자 계정을 함께 조회
+        employee, user = await _load_employee_with_user(db, employee_id)
         
         # 직원번호 중복 확인 (다른 직원과 중복되지 않도록)
         if employee_data.get('employee_number'):
-            existing_employee = db.query(Employee).filter(
+            employee_number_exists = await db.scalar(select(exists().where(
                 Employee.employee_number == employee_data['employee_number'],
                 Employee.id != employee_id
-            ).first()
-            if existing_employee:
+            )))
+            if employee_number_exists:
                 raise HTTPException(status_code=400, detail="이미 존재하는 직원번호입니다.")
         
         # 업데이트할 필드들
@@ -1086,11 +1374,11 @@ async def update_employee(
             employee.employee_number = employee_data['employee_number']
         if employee_data.get('username'):
             # 사용자명 중복 확인
-            existing_user = db.query(User).filter(
+            username_exists = await db.scalar(select(exists().where(
                 User.username == employee_data['username'],
                 User.id != user.id
-            ).first()
-            if existing_user:
+            )))
+            if username_exists:
                 raise HTTPException(status_code=400, detail="이미 존재하는 사용자명입니다.")
             user.username = employee_data['username']
         if employee_data.get('full_name'):
@@ -1102,7 +1390,7 @@ async def update_employee(
         if employee_data.get('department_id') is not None:
             # 부서 존재 확인
             if employee_data['department_id']:
-                department = db.query(Department).filter(Department.id == employee_data['department_id']).first()
+                department = await db.scalar(select(Department).where(Department.id == employee_data['department_id']))
                 if not department:
                     raise HTTPException(status_code=400, detail="존재하지 않는 부서입니다.")
             employee.department_id = employee_data['department_id']
@@ -1118,8 +1406,8 @@ async def update_employee(
                 employee.hire_date = None
         
         # 변경사항 저장
-        db.commit()
-        db.refresh(employee)
+        await db.commit()
+        invalidate_departments_cache()
         
         return {
             "success": True,
@@ -1139,7 +1427,7 @@ async def update_employee(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error updating employee {employee_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"직원 정보 업데이트 중 오류가 발생했습니다: {str(e)}")
 
@@ -1147,26 +1435,19 @@ async def update_employee(
 async def reset_employee_password(
     employee_id: int,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """직원 비밀번호 초기화"""
     from app.models.database import get_password_hash
     try:
-        # 직원 정보 조회
-        employee = db.query(Employee).filter(Employee.id == employee_id).first()
-        if not employee:
-            raise HTTPException(status_code=404, detail="직원을 찾을 수 없습니다.")
-        
-        # 해당 직원의 사용자 계정 조회
-        user = db.query(User).filter(User.id == employee.user_id).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자 계정을 찾을 수 없습니다.")
+        # 직원과 사용자 계정을 함께 조회
+        employee, user = await _load_employee_with_user(db, employee_id)
         
         # 비밀번호를 'abcd1234'로 초기화
         default_password = "abcd1234"
-        user.hashed_password = get_password_hash(default_password)
+        user.hashed_password = await run_in_threadpool(get_password_hash, default_password)
         
-        db.commit()
+        await db.commit()
         
         return {
             "success": True,
@@ -1176,21 +1457,24 @@ async def reset_employee_password(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"비밀번호 초기화 중 오류가 발생했습니다: {str(e)}")
 
 # 직원 API
 @app.get("/api/employee/status")
 async def get_employee_status(
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """직원 현재 상태 조회"""
-    employee = db.query(Employee).filter(Employee.user_id == current_user.id).first()
+    employee = await db.scalar(select(Employee).where(Employee.user_id == current_user.id))
     if not employee:
         raise HTTPException(status_code=404, detail="직원 정보를 찾을 수 없습니다.")
     
-    status_data = LocationService.get_employee_current_status(employee.id, db)
+    # 위치 서비스는 동기 세션 기반이므로 run_sync로 실행
+    status_data = await db.run_sync(
+        lambda session: LocationService.get_employee_current_status(employee.id, session)
+    )
     
     # 할당된 근무지 정보 추가
     assigned_sites_info = []
@@ -1219,23 +1503,27 @@ async def get_employee_status(
 async def check_employee_location(
     location_data: LocationRequest,
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """직원 위치 확인 및 지오펜스 체크"""
-    employee = db.query(Employee).filter(Employee.user_id == current_user.id).first()
+    employee = await db.scalar(select(Employee).where(Employee.user_id == current_user.id))
     if not employee:
         raise HTTPException(status_code=404, detail="직원 정보를 찾을 수 없습니다.")
     
     # 지오펜스 체크
-    geofence_result = LocationService.check_geofence(
-        location_data.latitude, 
-        location_data.longitude, 
-        employee.id, 
-        db
+    geofence_result = await db.run_sync(
+        lambda session: LocationService.check_geofence(
+            location_data.latitude, 
+            location_data.longitude, 
+            employee.id, 
+            session
+        )
     )
     
     # 할당된 모든 근무지와의 거리 정보 추가
-    assigned_sites = LocationService.get_employee_assigned_sites(employee.id, db)
+    assigned_sites = await db.run_sync(
+        lambda session: LocationService.get_employee_assigned_sites(employee.id, session)
+    )
     sites_distances = []
     
     for site in assigned_sites:
@@ -1264,10 +1552,10 @@ async def check_employee_location(
 async def employee_check_in(
     action_data: AttendanceAction,
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """출근 체크"""
-    employee = db.query(Employee).filter(Employee.user_id == current_user.id).first()
+    employee = await db.scalar(select(Employee).where(Employee.user_id == current_user.id))
     if not employee:
         raise HTTPException(status_code=404, detail="직원 정보를 찾을 수 없습니다.")
     
@@ -1278,7 +1566,9 @@ async def employee_check_in(
         'accuracy': action_data.accuracy or 10.0
     }
     
-    result = LocationService.process_location_update(employee.id, location_data, db)
+    result = await db.run_sync(
+        lambda session: LocationService.process_location_update(employee.id, location_data, session)
+    )
     
     if result["status"] == "success" and result.get("attendance", {}).get("action") == "check_in":
         return {"message": f"{result['site']}에서 출근이 완료되었습니다.", "result": result}
@@ -1292,20 +1582,22 @@ async def employee_check_in(
 async def employee_check_out(
     action_data: AttendanceAction,
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """퇴근 체크"""
-    employee = db.query(Employee).filter(Employee.user_id == current_user.id).first()
+    employee = await db.scalar(select(Employee).where(Employee.user_id == current_user.id))
     if not employee:
         raise HTTPException(status_code=404, detail="직원 정보를 찾을 수 없습니다.")
     
-    # 오늘의 출근 기록 확인
-    today = datetime.now().date()
-    attendance = db.query(AttendanceRecord).filter(
+    # 오늘의 출근 기록 확인 ([오늘 0시, 내일 0시) 구간)
+    today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    tomorrow_start = today_start + timedelta(days=1)
+    attendance = await db.scalar(select(AttendanceRecord).where(
         AttendanceRecord.employee_id == employee.id,
-        AttendanceRecord.check_in_time >= datetime.combine(today, datetime.min.time()),
+        AttendanceRecord.check_in_time >= today_start,
+        AttendanceRecord.check_in_time < tomorrow_start,
         AttendanceRecord.check_out_time.is_(None)
-    ).first()
+    ))
     
     if not attendance:
         raise HTTPException(status_code=400, detail="출근 기록이 없습니다.")
@@ -1319,9 +1611,7 @@ async def employee_check_out(
     work_duration = attendance.check_out_time - attendance.check_in_time
     attendance.total_work_minutes = int(work_duration.total_seconds() / 60)
     
-    db.commit()
-    
-    # 위치 이벤트 기록
+    # 위치 이벤트 기록 (퇴근 처리와 한 트랜잭션으로 커밋)
     checkout_event = LocationEvent(
         employee_id=employee.id,
         site_id=attendance.site_id,
@@ -1332,7 +1622,7 @@ async def employee_check_out(
         timestamp=attendance.check_out_time
     )
     db.add(checkout_event)
-    db.commit()
+    await db.commit()
     
     return {
         "message": "퇴근이 완료되었습니다.",
@@ -1342,88 +1632,123 @@ async def employee_check_out(
 @app.get("/api/employee/recent-activity")
 async def get_employee_recent_activity(
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """직원 최근 활동 조회"""
-    employee = db.query(Employee).filter(Employee.user_id == current_user.id).first()
+    employee = await db.scalar(select(Employee).where(Employee.user_id == current_user.id))
     if not employee:
         raise HTTPException(status_code=404, detail="직원 정보를 찾을 수 없습니다.")
     
-    recent_events = db.query(LocationEvent).filter(
-        LocationEvent.employee_id == employee.id
-    ).order_by(LocationEvent.timestamp.desc()).limit(10).all()
+    from app.models.database import Site
+    
+    # 사업장 이름은 JOIN으로 함께 조회 (이벤트별 추가 조회 없음)
+    rows = (await db.execute(
+        select(
+            LocationEvent.event_type,
+            Site.name,
+            LocationEvent.timestamp,
+            LocationEvent.accuracy
+        ).outerjoin(
+            Site, Site.id == LocationEvent.site_id
+        ).where(
+            LocationEvent.employee_id == employee.id
+        ).order_by(LocationEvent.timestamp.desc()).limit(10)
+    )).all()
     
     activities = []
-    for event in recent_events:
+    for event_type, site_name, timestamp, accuracy in rows:
         activities.append({
-            "event_type": event.event_type,
-            "site_name": event.site.name if event.site else None,
-            "timestamp": event.timestamp,
-            "accuracy": event.accuracy
+            "event_type": event_type,
+            "site_name": site_name,
+            "timestamp": timestamp,
+            "accuracy": accuracy
         })
     
     return activities
 
-@app.get("/api/employee/attendance-history")
+# 출입 기록 페이지 크기 기본값 (page 또는 cursor만 지정한 경우)
+ATTENDANCE_HISTORY_PAGE_SIZE = 50
+
+@app.get("/api/employee/attendance-history", response_model=AttendanceHistoryOut)
 async def get_employee_attendance_history(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     status: Optional[str] = None,
+    page: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """직원 출입 기록 조회"""
-    employee = db.query(Employee).filter(Employee.user_id == current_user.id).first()
+    """직원 출입 기록 조회
+    
+    - page 지정 시: 오프셋 방식 (limit 기본 50)
+    - cursor 또는 limit만 지정 시: (check_in_time, id) 기준 커서 방식, 다음 페이지가 있으면 next_cursor 반환
+    - 둘 다 없으면: 기존과 같이 전체 기록 반환
+    """
+    employee = await db.scalar(select(Employee).where(Employee.user_id == current_user.id))
     if not employee:
         raise HTTPException(status_code=404, detail="직원 정보를 찾을 수 없습니다.")
     
-    # 기본 쿼리 설정
-    query = db.query(AttendanceRecord).filter(AttendanceRecord.employee_id == employee.id)
+    # 조회 조건 (기록 목록과 통계 쿼리에 공통 적용)
+    filters = [AttendanceRecord.employee_id == employee.id]
     
     # 날짜 필터
     if start_date:
         start_datetime = datetime.strptime(start_date, "%Y-%m-%d")
-        query = query.filter(AttendanceRecord.check_in_time >= start_datetime)
+        filters.append(AttendanceRecord.check_in_time >= start_datetime)
     
     if end_date:
         end_datetime = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
-        query = query.filter(AttendanceRecord.check_in_time < end_datetime)
+        filters.append(AttendanceRecord.check_in_time < end_datetime)
     
     # 상태 필터
     if status:
         if status == "late":
-            query = query.filter(AttendanceRecord.is_late == True)
+            filters.append(AttendanceRecord.is_late == True)
         elif status == "working":
-            query = query.filter(AttendanceRecord.check_out_time.is_(None))
+            filters.append(AttendanceRecord.check_out_time.is_(None))
         elif status == "completed":
-            query = query.filter(AttendanceRecord.check_out_time.is_not(None))
-    
-    # 최신 순으로 정렬
-    records = query.order_by(AttendanceRecord.check_in_time.desc()).all()
-    
-    # 기록 변환
-    record_list = []
-    for record in records:
-        from app.models.database import Site
-        site = db.query(Site).filter(Site.id == record.site_id).first() if record.site_id else None
-        
-        record_list.append({
-            "id": record.id,
-            "check_in_time": record.check_in_time,
-            "check_out_time": record.check_out_time,
-            "total_work_minutes": record.total_work_minutes,
-            "is_late": record.is_late,
-            "status": record.status,
-            "site_name": site.name if site else None,
-            "check_in_location": record.check_in_location,
-            "check_out_location": record.check_out_location
-        })
-    
-    # 통계 계산
-    total_days = len([r for r in records if r.check_out_time])
-    total_minutes = sum([r.total_work_minutes for r in records if r.total_work_minutes])
+            filters.append(AttendanceRecord.check_out_time.is_not(None))
+    
+    # 최신 순으로 정렬 (사업장은 selectinload로 한 번에 로드)
+    #    그 외 관계는 raiseload로 막아 실수로 인한 N+1 지연 로딩을 즉시 오류로 드러냄
+    query = select(AttendanceRecord).options(selectinload(AttendanceRecord.site), raiseload("*")).where(
+        *filters
+    ).order_by(AttendanceRecord.check_in_time.desc(), AttendanceRecord.id.desc())
+    next_cursor = None
+    if page:
+        page_size = limit or ATTENDANCE_HISTORY_PAGE_SIZE
+        query = query.limit(page_size).offset((page - 1) * page_size)
+        records = (await db.scalars(query)).all()
+    elif cursor or limit:
+        page_size = limit or ATTENDANCE_HISTORY_PAGE_SIZE
+        # 커서(이전 페이지 마지막 기록의 출근 시간과 ID)보다 뒤의 기록만 조회
+        #    출근 시간이 같은 기록이 페이지 경계에 걸려도 ID로 구분되어 누락되지 않음
+        #    (다음 페이지 유무 확인용으로 1개 더 조회)
+        if cursor:
+            cursor_time, _, cursor_id = cursor.rpartition("_")
+            try:
+                cursor_key = (datetime.fromisoformat(cursor_time), int(cursor_id))
+            except ValueError:
+                raise HTTPException(status_code=400, detail="잘못된 커서 형식입니다.")
+            query = query.where(tuple_(AttendanceRecord.check_in_time, AttendanceRecord.id) < cursor_key)
+        records = (await db.scalars(query.limit(page_size + 1))).all()
+        if len(records) > page_size:
+            records = records[:page_size]
+            next_cursor = f"{records[-1].check_in_time.isoformat()}_{records[-1].id}"
+    else:
+        records = (await db.scalars(query)).all()
+    
+    # 통계 계산: 페이지와 무관하게 전체 조건에 대해 SQL 집계 함수로 계산
+    total_days, total_minutes, late_count = (await db.execute(
+        select(
+            func.count().filter(AttendanceRecord.check_out_time.isnot(None)),
+            func.coalesce(func.sum(AttendanceRecord.total_work_minutes), 0),
+            func.count().filter(AttendanceRecord.is_late == True)
+        ).where(*filters)
+    )).one()
     total_hours = round(total_minutes / 60, 1) if total_minutes else 0
-    late_count = len([r for r in records if r.is_late])
     avg_hours = round(total_hours / total_days, 1) if total_days > 0 else 0
     
     statistics = {
@@ -1433,9 +1758,11 @@ async def get_employee_attendance_history(
         "avg_hours": avg_hours
     }
     
+    # ORM 객체를 그대로 반환하면 AttendanceHistoryOut 응답 모델로 직렬화
     return {
-        "records": record_list,
-        "statistics": statistics
+        "records": records,
+        "statistics": statistics,
+        "next_cursor": next_cursor
     }
 
 # 채용 게시판 API
@@ -1447,7 +1774,7 @@ async def get_job_posts(
     latitude: Optional[float] = None,
     longitude: Optional[float] = None,
     radius: Optional[float] = 10,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """채용 공고 목록 조회"""
     
@@ -1459,31 +1786,37 @@ async def get_job_posts(
             "radius": radius
         }
     
-    result = JobBoardService.get_job_posts(
-        db=db,
-        page=page,
-        limit=limit,
-        search=search,
-        location_filter=location_filter
+    # 채용 게시판 서비스는 동기 세션 기반이므로 run_sync로 실행
+    result = await db.run_sync(
+        lambda session: JobBoardService.get_job_posts(
+            db=session,
+            page=page,
+            limit=limit,
+            search=search,
+            location_filter=location_filter
+        )
     )
     
     return result
 
 @app.get("/api/jobs/{job_id}")
-async def get_job_detail(job_id: int, db: Session = Depends(get_db)):
+async def get_job_detail(job_id: int, db: AsyncSession = Depends(get_async_db)):
     """채용 공고 상세 조회"""
-    return JobBoardService.get_job_post_detail(job_id, db)
+    return await db.run_sync(lambda session: JobBoardService.get_job_post_detail(job_id, session))
 
 @app.post("/api/jobs")
 async def create_job_post(
     job_data: JobPostCreate,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """채용 공고 작성"""
     
-    job_dict = job_data.dict()
-    result = JobBoardService.create_job_post(job_dict, current_user.id, db)
+    # deadline은 DB에 datetime으로 저장되므로 python 모드로 변환
+    job_dict = job_data.model_dump()
+    result = await db.run_sync(
+        lambda session: JobBoardService.create_job_post(job_dict, current_user.id, session)
+    )
     
     if result["success"]:
         return {"message": result["message"], "job_id": result["job_post"].id}
@@ -1494,14 +1827,14 @@ async def create_job_post(
 async def get_application_status(
     job_id: int,
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """사용자의 특정 공고 지원 상태 조회"""
     try:
-        application = db.query(JobApplication).filter(
+        application = await db.scalar(select(JobApplication).where(
             JobApplication.job_post_id == job_id,
             JobApplication.user_id == current_user.id
-        ).first()
+        ))
         
         if application:
             return {
@@ -1520,25 +1853,27 @@ async def get_application_status(
                 "has_applied": False,
                 "application": None
             }
-    except Exception as e:
-        print(f"Error getting application status: {str(e)}")
+    except Exception:
+        logger.exception("Error getting application status")
         raise HTTPException(status_code=500, detail="지원 상태 조회 중 오류가 발생했습니다.")
 
 @app.post("/api/jobs/{job_id}/apply")
 async def apply_to_job(
     job_id: int,
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    payment_manager: PaymentManager = Depends(get_payment_manager)
 ):
     """채용 공고 신청"""
     try:
-        result = JobBoardService.apply_to_job(job_id, current_user.id, db)
+        result = await db.run_sync(
+            lambda session: JobBoardService.apply_to_job(job_id, current_user.id, session)
+        )
         
         if result["success"]:
             # 승인된 경우에만 결제 요청 생성
             if result["application"].status == "approved":
-                payment_manager = PaymentManager()
-                payment_result = payment_manager.initiate_deposit_payment(
+                payment_result = await payment_manager.initiate_deposit_payment(
                     result["application"].id,
                     current_user.full_name,
                     db
@@ -1569,7 +1904,7 @@ async def apply_to_job(
             raise HTTPException(status_code=400, detail=result["error"])
             
     except Exception as e:
-        print(f"Apply error: {e}")  # 서버 로그용
+        logger.exception("Apply error")  # 서버 로그용
         raise HTTPException(status_code=500, detail=f"신청 처리 중 오류가 발생했습니다: {str(e)}")
 
 # 공고 신청자 목록 조회 API
@@ -1577,10 +1912,10 @@ async def apply_to_job(
 async def get_job_applications(
     job_id: int,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """공고 신청자 목록 조회"""
-    result = JobBoardService.get_job_applications(job_id, db)
+    result = await db.run_sync(lambda session: JobBoardService.get_job_applications(job_id, session))
     
     if result["success"]:
         return result
@@ -1597,14 +1932,16 @@ async def review_application(
     application_id: int,
     request: ApplicationReviewRequest,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """신청 승인/거절 처리"""
     if request.action not in ["approve", "reject"]:
         raise HTTPException(status_code=400, detail="잘못된 액션입니다.")
     
-    result = JobBoardService.review_application(
-        application_id, request.action, current_user.id, request.reason, db
+    result = await db.run_sync(
+        lambda session: JobBoardService.review_application(
+            application_id, request.action, current_user.id, request.reason, session
+        )
     )
     
     if result["success"]:
@@ -1617,10 +1954,10 @@ async def review_application(
 async def toggle_job_status(
     job_id: int,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """공고 상태 토글 (인원마감/재개방)"""
-    result = JobBoardService.toggle_job_status(job_id, db)
+    result = await db.run_sync(lambda session: JobBoardService.toggle_job_status(job_id, session))
     
     if result["success"]:
         return {
@@ -1635,11 +1972,11 @@ async def toggle_job_status(
 async def process_refund(
     application_id: int,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """관리자 직접 환불 처리"""
     try:
-        application = db.query(JobApplication).filter(JobApplication.id == application_id).first()
+        application = await db.scalar(APPLICATION_BY_ID_STMT, {"application_id": application_id})
         if not application:
             raise HTTPException(status_code=404, detail="신청을 찾을 수 없습니다.")
         
@@ -1666,7 +2003,7 @@ async def process_refund(
         )
         db.add(refund_log)
         
-        db.commit()
+        await db.commit()
         
         return {
             "success": True,
@@ -1674,17 +2011,17 @@ async def process_refund(
         }
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"환불 처리 중 오류가 발생했습니다: {str(e)}")
 
 @app.post("/api/auto-refund/{application_id}")
 async def auto_refund_on_completion(
     application_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """근무 완료 시 자동 환불"""
     try:
-        application = db.query(JobApplication).filter(JobApplication.id == application_id).first()
+        application = await db.scalar(APPLICATION_BY_ID_STMT, {"application_id": application_id})
         if not application:
             return {"success": False, "message": "신청을 찾을 수 없습니다."}
         
@@ -1710,7 +2047,7 @@ async def auto_refund_on_completion(
         )
         db.add(refund_log)
         
-        db.commit()
+        await db.commit()
         
         return {
             "success": True,
@@ -1718,33 +2055,31 @@ async def auto_refund_on_completion(
         }
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"success": False, "message": f"자동 환불 중 오류가 발생했습니다: {str(e)}"}
 
 @app.delete("/api/admin/jobs/{job_id}")
 async def delete_job_post(
     job_id: int,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """공고 삭제"""
     try:
         # 공고 조회
-        job_post = db.query(JobPost).filter(JobPost.id == job_id).first()
+        job_post = await db.scalar(select(JobPost).where(JobPost.id == job_id))
         if not job_post:
             raise HTTPException(status_code=404, detail="공고를 찾을 수 없습니다.")
         
-        # 관련 신청 정보들 삭제
-        applications = db.query(JobApplication).filter(JobApplication.job_post_id == job_id).all()
-        for application in applications:
-            # 결제 로그 삭제
-            db.query(PaymentLog).filter(PaymentLog.application_id == application.id).delete()
-            # 신청 삭제
-            db.delete(application)
+        # 관련 결제 로그와 신청 정보를 신청 건수와 무관하게 일괄 DELETE 두 번으로 삭제
+        # (ON DELETE CASCADE가 적용되지 않는 SQLite/기존 테이블 대비)
+        application_ids = select(JobApplication.id).where(JobApplication.job_post_id == job_id)
+        await db.execute(delete(PaymentLog).where(PaymentLog.application_id.in_(application_ids)))
+        await db.execute(delete(JobApplication).where(JobApplication.job_post_id == job_id))
         
         # 공고 삭제
-        db.delete(job_post)
-        db.commit()
+        await db.delete(job_post)
+        await db.commit()
         
         return {
             "success": True,
@@ -1752,41 +2087,56 @@ async def delete_job_post(
         }
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"공고 삭제 중 오류가 발생했습니다: {str(e)}")
 
 @app.delete("/api/my-applications/{application_id}")
 async def cancel_application(
     application_id: int,
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """신청 취소"""
     try:
-        # 신청 조회
-        application = db.query(JobApplication).filter(
+        # 취소 가능 조건(본인 신청, 근무 시작 전, 미결제 또는 환불 완료)을 WHERE에 넣어 DELETE로 처리
+        cancelable = (
             JobApplication.id == application_id,
-            JobApplication.user_id == current_user.id
-        ).first()
-        
-        if not application:
-            raise HTTPException(status_code=404, detail="신청 정보를 찾을 수 없습니다.")
+            JobApplication.user_id == current_user.id,
+            JobApplication.status.not_in(["completed", "working"]),
+            or_(JobApplication.deposit_paid == False, JobApplication.deposit_refunded == True)
+        )
         
-        # 취소 가능한 상태 확인
-        if application.status in ["completed", "working"]:
-            raise HTTPException(status_code=400, detail="이미 근무가 시작된 신청은 취소할 수 없습니다.")
+        # 결제 로그를 같은 트랜잭션에서 먼저 삭제 (외래키 CASCADE가 없는 기존 테이블에서도 신청 삭제가 막히지 않도록,
+        # 환불 완료된 신청의 로그도 CASCADE에 맡기지 않고 명시적으로 삭제)
+        await db.execute(
+            delete(PaymentLog).where(
+                PaymentLog.application_id.in_(select(JobApplication.id).where(*cancelable))
+            )
+        )
         
-        if application.deposit_paid and not application.deposit_refunded:
+        deleted = (await db.execute(
+            delete(JobApplication)
+            .where(*cancelable)
+            .returning(JobApplication.id)
+        )).first()
+        
+        if not deleted:
+            # 삭제되지 않은 경우에만 원인 확인용으로 조회 (먼저 실행한 로그 삭제는 롤백)
+            await db.rollback()
+            application = (await db.execute(
+                select(JobApplication.status, JobApplication.deposit_paid, JobApplication.deposit_refunded)
+                .where(JobApplication.id == application_id, JobApplication.user_id == current_user.id)
+            )).first()
+            
+            if not application:
+                raise HTTPException(status_code=404, detail="신청 정보를 찾을 수 없습니다.")
+            
+            if application.status in ["completed", "working"]:
+                raise HTTPException(status_code=400, detail="이미 근무가 시작된 신청은 취소할 수 없습니다.")
+            
             raise HTTPException(status_code=400, detail="보증금이 결제된 신청은 관리자에게 문의하세요.")
         
-        # 관련 데이터 삭제
-        # 결제 로그 삭제 (보증금이 결제되지 않은 경우)
-        if not application.deposit_paid:
-            db.query(PaymentLog).filter(PaymentLog.application_id == application_id).delete()
-        
-        # 신청 삭제
-        db.delete(application)
-        db.commit()
+        await db.commit()
         
         return {
             "success": True,
@@ -1794,38 +2144,38 @@ async def cancel_application(
         }
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"신청 취소 중 오류가 발생했습니다: {str(e)}")
 
 @app.get("/api/my-applications")
 async def get_my_applications(
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """나의 신청 목록"""
-    return JobBoardService.get_user_applications(current_user.id, db)
+    return await db.run_sync(lambda session: JobBoardService.get_user_applications(current_user.id, session))
 
 # 결제 API
 @app.post("/api/payment/callback")
 async def payment_callback(
     callback_data: PaymentCallback,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    payment_manager: PaymentManager = Depends(get_payment_manager)
 ):
     """네이버페이 결제 콜백"""
     
     if callback_data.status == "SUCCESS":
-        payment_manager = PaymentManager()
-        result = payment_manager.complete_deposit_payment(
+        result = await db.run_sync(lambda session: payment_manager.complete_deposit_payment(
             callback_data.payment_id,
             callback_data.application_id,
-            db
-        )
+            session
+        ))
         
         if result["success"]:
             # 근무지 위치 업데이트
-            location_result = JobBoardService.update_employee_work_location(
-                callback_data.application_id, db
-            )
+            location_result = await db.run_sync(lambda session: JobBoardService.update_employee_work_location(
+                callback_data.application_id, session
+            ))
             
             return {
                 "message": "결제가 완료되었습니다. 근무지가 설정되었습니다.",
@@ -1840,12 +2190,12 @@ async def payment_callback(
 async def complete_work(
     application_id: int,
     current_user: User = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """근무 완료 처리 및 보증금 환불"""
     
     # 근무 완료 처리
-    work_result = JobBoardService.complete_work(application_id, db)
+    work_result = await db.run_sync(lambda session: JobBoardService.complete_work(application_id, session))
     
     if work_result["success"]:
         # 자동 환불 처리
@@ -1923,24 +2273,29 @@ async def coordinates_to_address(
 
 # 레거시 API (기존 호환성을 위해 유지)
 @app.get("/employees")
-async def legacy_get_employees(db: Session = Depends(get_db)):
+async def legacy_get_employees(db: AsyncSession = Depends(get_async_db)):
     """레거시: 직원 목록 조회"""
-    employees = db.query(Employee).all()
-    result = []
-    for emp in employees:
-        user = db.query(User).filter(User.id == emp.user_id).first()
-        result.append({
-            "id": emp.id,
-            "name": user.full_name,
-            "team": emp.department.name if emp.department else None
-        })
-    return result
+    # 사용자 이름과 부서명을 JOIN 한 번으로 함께 조회
+    rows = (await db.execute(
+        select(Employee.id, User.full_name, Department.name)
+        .join(User, User.id == Employee.user_id)
+        .outerjoin(Department, Department.id == Employee.department_id)
+        .order_by(Employee.id)
+    )).all()
+    return [
+        {
+            "id": employee_id,
+            "name": full_name,
+            "team": department_name
+        }
+        for employee_id, full_name, department_name in rows
+    ]
 
 @app.get("/sites")
-async def legacy_get_sites(db: Session = Depends(get_db)):
+async def legacy_get_sites(db: AsyncSession = Depends(get_async_db)):
     """레거시: 근무지 목록 조회"""
     from app.models.database import Site
-    sites = db.query(Site).all()
+    sites = (await db.scalars(select(Site))).all()
     return [
         {
             "id": site.id,
@@ -1952,10 +2307,61 @@ async def legacy_get_sites(db: Session = Depends(get_db)):
         for site in sites
     ]
 
+# 한 번에 모아서 처리할 최대 위치 이벤트 수
+LOCATION_BATCH_MAX_EVENTS = 500
+# 위치 이벤트 처리 결과 최대 대기 시간 (초)
+LOCATION_EVENT_TIMEOUT_SECONDS = 30
+
+def _fail_location_futures(batch: list, error: Exception):
+    """아직 결과를 받지 못한 위치 이벤트 요청을 오류로 종료"""
+    for _, _, future in batch:
+        if not future.done():
+            future.set_exception(error)
+
+async def flush_location_events(location_queue: asyncio.Queue):
+    """대기 중인 위치 이벤트를 모아 한 트랜잭션으로 처리하고 요청별 결과 전달
+    
+    이전 배치를 처리하는 동안 쌓인 이벤트가 다음 배치가 되므로, 요청이 적을 때는
+    지연 없이 한 건씩, 몰릴 때는 여러 건을 한 번의 커밋으로 처리
+    """
+    batch = []
+    try:
+        while True:
+            batch = [await location_queue.get()]
+            # 한 배치에서 어떤 오류가 나도 작업은 계속 실행되고 해당 배치의 요청만 오류로 종료
+            try:
+                while len(batch) < LOCATION_BATCH_MAX_EVENTS and not location_queue.empty():
+                    batch.append(location_queue.get_nowait())
+                
+                events = [(employee_id, location_data) for employee_id, location_data, _ in batch]
+                async with AsyncSessionLocal() as session:
+                    results = await session.run_sync(
+                        lambda sync_session: LocationService.process_location_batch(events, sync_session)
+                    )
+                if len(results) != len(batch):
+                    raise RuntimeError(f"Location batch returned {len(results)} results for {len(batch)} events")
+                
+                for (_, _, future), result in zip(batch, results):
+                    if future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+            except Exception as e:
+                logger.exception("Location batch error")
+                _fail_location_futures(batch, e)
+            batch = []
+    finally:
+        # 작업이 취소(앱 종료)되면 처리 중이거나 대기 중인 요청이 계속 기다리지 않도록 오류로 종료
+        while not location_queue.empty():
+            batch.append(location_queue.get_nowait())
+        _fail_location_futures(batch, RuntimeError("위치 이벤트 처리 작업이 종료되었습니다."))
+
 @app.post("/track-location")
 async def legacy_track_location(
     event_data: dict,
-    db: Session = Depends(get_db)
+    request: Request
 ):
     """레거시: 위치 추적 (기존 모바일 앱 호환성)"""
     employee_id = event_data.get('employee_id')
@@ -1969,7 +2375,13 @@ async def legacy_track_location(
         'accuracy': event_data.get('accuracy', 10.0)
     }
     
-    result = LocationService.process_location_update(employee_id, location_data, db)
+    # 위치 이벤트는 배치 처리 작업에 넘기고 해당 이벤트의 처리 결과를 기다림
+    result_future = asyncio.get_running_loop().create_future()
+    await request.app.state.location_queue.put((employee_id, location_data, result_future))
+    try:
+        result = await asyncio.wait_for(result_future, LOCATION_EVENT_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="위치 처리 시간이 초과되었습니다.")
     
     return {
         "status": "success",
@@ -1984,13 +2396,13 @@ async def legacy_track_location(
 async def admin_process_refund(
     application_id: int,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    payment_manager: PaymentManager = Depends(get_payment_manager)
 ):
     """관리자가 수동으로 보증금 환불 처리"""
     try:
-        application = db.query(JobApplication).filter(
-            JobApplication.id == application_id
-        ).first()
+        # 환불 처리가 끝날 때까지 행 잠금 (중복 환불 방지)
+        application = await db.scalar(APPLICATION_BY_ID_FOR_UPDATE_STMT, {"application_id": application_id})
         
         if not application:
             raise HTTPException(status_code=404, detail="신청 정보를 찾을 수 없습니다.")
@@ -2002,8 +2414,9 @@ async def admin_process_refund(
             raise HTTPException(status_code=400, detail="이미 환불 처리되었습니다.")
         
         # 환불 처리 (관리자 강제 환불 모드)
-        payment_manager = PaymentManager()
-        refund_result = payment_manager.process_deposit_refund(application_id, db, force_refund=True)
+        refund_result = await db.run_sync(
+            lambda session: payment_manager.process_deposit_refund(application_id, session, force_refund=True)
+        )
         
         if refund_result["success"]:
             return {"message": refund_result["message"]}
@@ -2018,13 +2431,12 @@ async def admin_process_refund(
 async def admin_complete_work(
     application_id: int,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """관리자가 수동으로 근무 완료 처리"""
     try:
-        application = db.query(JobApplication).filter(
-            JobApplication.id == application_id
-        ).first()
+        # 근무 완료 처리가 끝날 때까지 행 잠금
+        application = await db.scalar(APPLICATION_BY_ID_FOR_UPDATE_STMT, {"application_id": application_id})
         
         if not application:
             raise HTTPException(status_code=404, detail="신청 정보를 찾을 수 없습니다.")
@@ -2033,7 +2445,7 @@ async def admin_complete_work(
             raise HTTPException(status_code=400, detail="근무 중이 아닌 신청입니다.")
         
         # 근무 완료 처리
-        work_result = JobBoardService.complete_work(application_id, db)
+        work_result = await db.run_sync(lambda session: JobBoardService.complete_work(application_id, session))
         
         if work_result["success"]:
             return {"message": work_result["message"]}
@@ -2042,6 +2454,68 @@ async def admin_complete_work(
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"근무 완료 처리 중 오류가 발생했습니다: {str(e)}")
+
+# 리포트 데이터 캐시 (리포트 생성과 CSV 내보내기가 같은 조건이면 집계를 다시 하지 않음)
+REPORT_CACHE_TTL_SECONDS = 60
+report_cache = TTLCache(maxsize=32, ttl=REPORT_CACHE_TTL_SECONDS)
+
+async def _get_report(
+    db: AsyncSession,
+    report_type: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    year: Optional[int],
+    month: Optional[int]
+) -> Tuple[Dict, str]:
+    """리포트 데이터와 CSV 파일명 반환 (같은 유형/기간은 캐시된 데이터 재사용)"""
+    today = date.today()
+    if report_type == "daily":
+        if not start_date:
+            target_date = today
+        else:
+            target_date = date.fromisoformat(start_date)
+        cache_key = ("daily", target_date)
+        filename = f"daily_report_{target_date.strftime('%Y%m%d')}.csv"
+        generate = lambda session: ReportService.generate_daily_report(target_date, session)
+        
+    elif report_type == "weekly":
+        if not start_date:
+            # 이번 주 월요일
+            start_date_obj = today - timedelta(days=today.weekday())
+        else:
+            start_date_obj = date.fromisoformat(start_date)
+        cache_key = ("weekly", start_date_obj)
+        filename = f"weekly_report_{start_date_obj.strftime('%Y%m%d')}.csv"
+        generate = lambda session: ReportService.generate_weekly_report(start_date_obj, session)
+        
+    elif report_type == "monthly":
+        if not (year and month):
+            year, month = today.year, today.month
+        cache_key = ("monthly", year, month)
+        filename = f"monthly_report_{year}{month:02d}.csv"
+        generate = lambda session: ReportService.generate_monthly_report(year, month, session)
+        
+    elif report_type == "violations":
+        if start_date and end_date:
+            start_date_obj = date.fromisoformat(start_date)
+            end_date_obj = date.fromisoformat(end_date)
+        else:
+            # 최근 30일
+            end_date_obj = today
+            start_date_obj = end_date_obj - timedelta(days=30)
+        cache_key = ("violations", start_date_obj, end_date_obj)
+        filename = f"violations_report_{start_date_obj.strftime('%Y%m%d')}_{end_date_obj.strftime('%Y%m%d')}.csv"
+        generate = lambda session: ReportService.generate_violation_report(start_date_obj, end_date_obj, session)
+        
+    else:
+        raise HTTPException(status_code=400, detail="지원하지 않는 리포트 유형입니다.")
+    
+    report_data = report_cache.get(cache_key)
+    if report_data is None:
+        report_data = await db.run_sync(generate)
+        report_cache[cache_key] = report_data
+    return report_data, filename
+
 @app.post("/api/admin/reports/generate")
 async def generate_report(
     report_type: str = Query(...),
@@ -2050,48 +2524,11 @@ async def generate_report(
     year: Optional[int] = Query(None),
     month: Optional[int] = Query(None),
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """리포트 생성"""
     try:
-        if report_type == "daily":
-            if not start_date:
-                target_date = date.today()
-            else:
-                target_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-            
-            report_data = ReportService.generate_daily_report(target_date, db)
-            
-        elif report_type == "weekly":
-            if not start_date:
-                # 이번 주 월요일
-                today = date.today()
-                start_date_obj = today - timedelta(days=today.weekday())
-            else:
-                start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-            
-            report_data = ReportService.generate_weekly_report(start_date_obj, db)
-            
-        elif report_type == "monthly":
-            if year and month:
-                report_data = ReportService.generate_monthly_report(year, month, db)
-            else:
-                today = date.today()
-                report_data = ReportService.generate_monthly_report(today.year, today.month, db)
-                
-        elif report_type == "violations":
-            if start_date and end_date:
-                start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-                end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
-            else:
-                # 최근 30일
-                end_date_obj = date.today()
-                start_date_obj = end_date_obj - timedelta(days=30)
-            
-            report_data = ReportService.generate_violation_report(start_date_obj, end_date_obj, db)
-            
-        else:
-            raise HTTPException(status_code=400, detail="지원하지 않는 리포트 유형입니다.")
+        report_data, _ = await _get_report(db, report_type, start_date, end_date, year, month)
         
         return {
             "success": True,
@@ -2110,58 +2547,16 @@ async def export_report(
     year: Optional[int] = None,
     month: Optional[int] = None,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """리포트 CSV 내보내기"""
     try:
-        # 먼저 리포트 데이터 생성
-        if report_type == "daily":
-            if not start_date:
-                target_date = date.today()
-            else:
-                target_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-            report_data = ReportService.generate_daily_report(target_date, db)
-            filename = f"daily_report_{target_date.strftime('%Y%m%d')}.csv"
-            
-        elif report_type == "weekly":
-            if not start_date:
-                today = date.today()
-                start_date_obj = today - timedelta(days=today.weekday())
-            else:
-                start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-            report_data = ReportService.generate_weekly_report(start_date_obj, db)
-            filename = f"weekly_report_{start_date_obj.strftime('%Y%m%d')}.csv"
-            
-        elif report_type == "monthly":
-            if year and month:
-                report_data = ReportService.generate_monthly_report(year, month, db)
-                filename = f"monthly_report_{year}{month:02d}.csv"
-            else:
-                today = date.today()
-                report_data = ReportService.generate_monthly_report(today.year, today.month, db)
-                filename = f"monthly_report_{today.year}{today.month:02d}.csv"
-                
-        elif report_type == "violations":
-            if start_date and end_date:
-                start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-                end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
-            else:
-                end_date_obj = date.today()
-                start_date_obj = end_date_obj - timedelta(days=30)
-            report_data = ReportService.generate_violation_report(start_date_obj, end_date_obj, db)
-            filename = f"violations_report_{start_date_obj.strftime('%Y%m%d')}_{end_date_obj.strftime('%Y%m%d')}.csv"
-            
-        else:
-            raise HTTPException(status_code=400, detail="지원하지 않는 리포트 유형입니다.")
-        
-        # CSV 생성
-        csv_content = ReportService.export_report_to_csv(report_data)
-        
-        # CSV를 바이트 스트림으로 변환
-        csv_bytes = csv_content.encode('utf-8-sig')  # BOM 추가로 한글 깨짐 방지
+        # 먼저 리포트 데이터 생성 (직전에 같은 조건으로 생성했다면 캐시 사용)
+        report_data, filename = await _get_report(db, report_type, start_date, end_date, year, month)
         
+        # CSV를 전체 문자열로 만들지 않고 행 단위로 생성하여 스트리밍 (BOM 포함)
         return StreamingResponse(
-            io.BytesIO(csv_bytes),
+            ReportService.iter_report_csv(report_data),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -2173,12 +2568,12 @@ async def export_report(
 @app.post("/api/admin/violations/detect")
 async def detect_violations(
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """위반 사항 자동 감지 및 생성"""
     try:
         # ViolationDetectionService를 사용한 종합적인 위반 사항 감지
-        result = ViolationDetectionService.run_comprehensive_detection(db)
+        result = await db.run_sync(ViolationDetectionService.run_comprehensive_detection)
         
         if result["success"]:
             # 감지된 위반사항 유형 리스트 생성
@@ -2211,42 +2606,85 @@ async def detect_violations(
             }
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"위반사항 감지 중 오류가 발생했습니다: {str(e)}")
 
+# 위반사항 처리 액션별 변경 상태
+VIOLATION_REVIEW_STATUSES = {
+    "acknowledge": "acknowledged",
+    "resolve": "resolved",
+    "dismiss": "dismissed"
+}
+
+async def _review_violations(
+    db: AsyncSession,
+    violation_ids: List[int],
+    action: str,
+    notes: Optional[str],
+    reviewer: User
+) -> int:
+    """위반사항 상태를 UPDATE 한 번으로 일괄 변경하고 변경된 건수 반환"""
+    if action not in VIOLATION_REVIEW_STATUSES:
+        raise HTTPException(status_code=400, detail="잘못된 처리 액션입니다.")
+    
+    values = {
+        "status": VIOLATION_REVIEW_STATUSES[action],
+        "reviewed_by": reviewer.id,
+        "reviewed_at": datetime.now()
+    }
+    if notes:
+        values["resolution_notes"] = notes
+    
+    result = await db.execute(
+        update(Violation).where(Violation.id.in_(violation_ids)).values(**values)
+    )
+    await db.commit()
+    return result.rowcount
+
+@app.put("/api/admin/violations/review")
+async def review_violations(
+    review_data: ViolationBatchReviewRequest,
+    current_user: User = Depends(require_manager_or_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """위반사항 일괄 검토 및 처리"""
+    if not review_data.violation_ids:
+        raise HTTPException(status_code=400, detail="처리할 위반사항을 선택해주세요.")
+    
+    updated_count = await _review_violations(
+        db, review_data.violation_ids, review_data.action, review_data.notes, current_user
+    )
+    
+    return {
+        "success": True,
+        "message": f"{updated_count}건의 위반사항이 {review_data.action} 처리되었습니다.",
+        "updated_count": updated_count
+    }
+
 @app.put("/api/admin/violations/{violation_id}/review")
 async def review_violation(
     violation_id: int,
     action: str,  # acknowledge, resolve, dismiss
     notes: Optional[str] = None,
     current_user: User = Depends(require_manager_or_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """위반사항 검토 및 처리"""
-    violation = db.query(Violation).filter(Violation.id == violation_id).first()
-    if not violation:
+    updated_count = await _review_violations(db, [violation_id], action, notes, current_user)
+    if not updated_count:
         raise HTTPException(status_code=404, detail="위반사항을 찾을 수 없습니다.")
     
-    if action == "acknowledge":
-        violation.status = "acknowledged"
-    elif action == "resolve":
-        violation.status = "resolved"
-    elif action == "dismiss":
-        violation.status = "dismissed"
-    else:
-        raise HTTPException(status_code=400, detail="잘못된 처리 액션입니다.")
-    
-    violation.reviewed_by = current_user.id
-    violation.reviewed_at = datetime.now()
-    if notes:
-        violation.resolution_notes = notes
-    
-    db.commit()
-    
     return {
         "success": True,
         "message": f"위반사항이 {action} 처리되었습니다."
     }
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop 이벤트 루프와 httptools HTTP 파서 사용 (uvloop는 Windows 미지원)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools"
+    )
\ No newline at end of file
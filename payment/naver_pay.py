@@ -1,4 +1,4 @@
-import os, uuid, hmac, hashlib, time
+import os, uuid, hmac, time
 import httpx
 
 NAVER_BASES = {
@@ -21,14 +21,21 @@ BASE_URL = os.getenv("BASE_URL", "http://localhost:8000")
 
 DEPOSIT_AMOUNT = 5000
 
+# 서명용 HMAC: 키 설정과 Client ID 부분은 한 번만 계산해 두고 요청마다 copy()해서 사용
+# (네이버 규격상 SHA-256 고정. 이름으로 지정하면 OpenSSL HMAC 구현을 사용)
+_HMAC_KEY = (CLIENT_SECRET or "").encode()
+_BASE_MAC = hmac.new(_HMAC_KEY, (CLIENT_ID or "").encode(), "sha256")
+
 def _timestamp_ms():
     return str(int(time.time() * 1000))
 
-def naver_auth_headers(body: str = "") -> dict:
-    """HMAC 서명(스켈레톤): 실제 규격대로 수정하세요."""
+def naver_auth_headers(body: bytes = b"") -> dict:
+    """HMAC 서명(스켈레톤): 실제 규격대로 수정하세요. body는 실제로 전송할 요청 본문 바이트"""
     ts = _timestamp_ms()
-    raw = (CLIENT_ID or "") + ts + (body or "")
-    signature = hmac.new((CLIENT_SECRET or "").encode(), raw.encode(), hashlib.sha256).hexdigest()
+    mac = _BASE_MAC.copy()
+    mac.update(ts.encode())
+    mac.update(body)
+    signature = mac.hexdigest()
     return {
         "X-Naver-Client-Id": CLIENT_ID or "",
         "X-Naver-Timestamp": ts,
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import Session
 import uuid
 from urllib.parse import urlencode, quote
@@ -9,13 +10,16 @@ from app.auth import require_employee  # 위치에 맞게 사용
 
 router = APIRouter(prefix="/api/payment/naver", tags=["payment"])
 
+# 본인 신청 조회 구문 (모듈 로드 시 한 번만 구성하고 값은 실행 시 바인딩)
+APPLICATION_BY_ID_USER_STMT = select(JobApplication).where(
+    JobApplication.id == bindparam("application_id"),
+    JobApplication.user_id == bindparam("user_id")
+)
+
 @router.post("/create")
 def create_payment(application_id: int, user=Depends(require_employee), db: Session = Depends(get_db)):
     # 1) 신청 조회(본인 것만)
-    app_row = db.query(JobApplication).filter(
-        JobApplication.id == application_id,
-        JobApplication.user_id == user.id
-    ).first()
+    app_row = db.scalar(APPLICATION_BY_ID_USER_STMT, {"application_id": application_id, "user_id": user.id})
     if not app_row:
         raise HTTPException(status_code=404, detail="Application not found")
 
@@ -40,11 +44,9 @@ def create_payment(application_id: int, user=Depends(require_employee), db: Sess
     }, quote_via=quote)
     payment_url = f"{PAY_BASE}/web/checkout?{q}"
 
-    # 5) DB 반영
+    # 5) DB 반영 (커밋은 get_db의 트랜잭션 종료 시 수행)
     app_row.payment_id = merchant_uid          # ← 주문키 저장(승인/환불 시 사용)
     if not app_row.deposit_amount:
         app_row.deposit_amount = DEPOSIT_AMOUNT
-    db.add(app_row)
-    db.commit()
 
     return {"success": True, "payment_url": payment_url}
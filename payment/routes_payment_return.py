@@ -1,51 +1,100 @@
 from fastapi import APIRouter, Request, Depends
-from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
-import httpx, json, os
+from fastapi.responses import HTMLResponse, Response
+from cachetools import TTLCache
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+import json, os
 
 from payment.naver_pay import API_BASE, naver_auth_headers
-from app.models.database import get_db, JobApplication
+from app.models.database import get_async_db, JobApplication
 
 router = APIRouter(prefix="/payment/naver/return", tags=["payment-return"])
 
+# 고정 안내 페이지 (요청마다 인코딩하지 않도록 모듈 로드 시 바이트로 준비)
+HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+ORDER_NOT_FOUND_HTML = "<h3>주문 정보를 찾을 수 없습니다.</h3>".encode()
+PAYMENT_SUCCESS_HTML = """
+      <html><body style="font-family:sans-serif">
+      <h3>결제가 완료되었습니다.</h3>
+      <script>setTimeout(function(){ window.location.href='/my-applications'; }, 1000);</script>
+      </body></html>
+    """.encode()
+PAYMENT_ALREADY_DONE_HTML = """
+      <html><body style="font-family:sans-serif">
+      <h3>이미 처리된 결제입니다.</h3>
+      <script>setTimeout(function(){ window.location.href='/my-applications'; }, 1000);</script>
+      </body></html>
+    """.encode()
+PAYMENT_PROCESSING_HTML = """
+      <html><body style="font-family:sans-serif">
+      <h3>결제를 처리하고 있습니다. 잠시 후 새로고침해 주세요.</h3>
+      <script>setTimeout(function(){ window.location.reload(); }, 3000);</script>
+      </body></html>
+    """.encode()
+PAYMENT_CANCEL_HTML = "<h3>사용자가 결제를 취소했습니다.</h3>".encode()
+PAYMENT_FAIL_HTML = "<h3>결제에 실패했습니다.</h3>".encode()
+
+# 결제 승인 중복 처리 방지 (승인 진행 중 새로고침 등으로 같은 주문의 콜백이 다시 오면 승인 API를 다시 호출하지 않음)
+PAYMENT_CALLBACK_TTL_SECONDS = 300
+processing_payments = TTLCache(maxsize=10000, ttl=PAYMENT_CALLBACK_TTL_SECONDS)
+
 @router.get("/success", response_class=HTMLResponse)
-async def payment_success(merchant_uid: str, request: Request, db: Session = Depends(get_db)):
-    # 1) 주문 찾기 (payment_id)
-    app_row = db.query(JobApplication).filter(JobApplication.payment_id == merchant_uid).first()
+async def payment_success(merchant_uid: str, request: Request, db: AsyncSession = Depends(get_async_db)):
+    # 0) 같은 주문의 승인이 진행 중이면 결과가 확정되지 않았으므로 처리 중 안내 (새로고침 시 다시 확인)
+    if merchant_uid in processing_payments:
+        return Response(content=PAYMENT_PROCESSING_HTML, media_type=HTML_MEDIA_TYPE)
+
+    # 1) 주문 찾기 (payment_id, 승인 요청에 필요한 금액과 결제 여부만 조회)
+    app_row = (await db.execute(
+        select(JobApplication.id, JobApplication.deposit_amount, JobApplication.deposit_paid)
+        .where(JobApplication.payment_id == merchant_uid)
+    )).first()
     if not app_row:
-        return HTMLResponse("<h3>주문 정보를 찾을 수 없습니다.</h3>", status_code=404)
-
-    # 2) 결제 승인(검증) 호출 — 실제 스펙으로 교체
-    payload = {
-        "merchantId": os.getenv("NAVER_PAY_MERCHANT_ID", ""),
-        "merchantUid": merchant_uid,
-        "amount": app_row.deposit_amount or 5000
-    }
-    headers = naver_auth_headers(json.dumps(payload, ensure_ascii=False))
-    async with httpx.AsyncClient(timeout=15) as client:
-        r = await client.post(f"{API_BASE}/v1/payments/confirm", headers=headers, json=payload)
+        return Response(content=ORDER_NOT_FOUND_HTML, media_type=HTML_MEDIA_TYPE, status_code=404)
+    if app_row.deposit_paid:
+        return Response(content=PAYMENT_ALREADY_DONE_HTML, media_type=HTML_MEDIA_TYPE)
+
+    # 승인 API 호출 전에 표시해 두어 동시에 들어온 중복 콜백도 차단
+    processing_payments[merchant_uid] = True
+
+    try:
+        # 2) 결제 승인(검증) 호출 — 실제 스펙으로 교체
+        payload = {
+            "merchantId": os.getenv("NAVER_PAY_MERCHANT_ID", ""),
+            "merchantUid": merchant_uid,
+            "amount": app_row.deposit_amount or 5000
+        }
+        # 본문은 한 번만 직렬화하여 서명과 전송에 같은 바이트 사용
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        headers = naver_auth_headers(body)
+        # 앱 시작 시 만든 공용 클라이언트로 keep-alive 연결 재사용
+        client = request.app.state.http_client
+        r = await client.post(f"{API_BASE}/v1/payments/confirm", headers=headers, content=body)
         ok = r.status_code == 200
         data = r.json() if ok else {"code": r.status_code, "body": r.text}
 
-    if not ok:
-        return HTMLResponse(f"<h3>결제 승인 실패</h3><pre>{data}</pre>", status_code=400)
+        if not ok:
+            return HTMLResponse(f"<h3>결제 승인 실패</h3><pre>{data}</pre>", status_code=400)
 
-    # 3) 성공 처리
-    app_row.deposit_paid = True
-    db.add(app_row)
-    db.commit()
+        # 3) 성공 처리: 아직 결제 완료가 아닌 경우에만 UPDATE 한 번으로 갱신
+        #    (ORM 객체를 다시 로드하지 않으며, 중복 콜백이면 갱신되는 행이 없음)
+        await db.execute(
+            update(JobApplication)
+            .where(JobApplication.id == app_row.id, JobApplication.deposit_paid == False)
+            .values(deposit_paid=True)
+        )
+        await db.commit()
+    finally:
+        # 처리 중 표시는 승인 요청이 진행되는 동안만 유지
+        # (성공하면 이후 콜백은 deposit_paid로 완료 안내, 실패·오류·요청 취소 시에는 다시 시도 가능)
+        processing_payments.pop(merchant_uid, None)
 
-    return HTMLResponse("""
-      <html><body style="font-family:sans-serif">
-      <h3>결제가 완료되었습니다.</h3>
-      <script>setTimeout(function(){ window.location.href='/my-applications'; }, 1000);</script>
-      </body></html>
-    """)
+    return Response(content=PAYMENT_SUCCESS_HTML, media_type=HTML_MEDIA_TYPE)
 
 @router.get("/cancel", response_class=HTMLResponse)
-def payment_cancel(merchant_uid: str):
-    return HTMLResponse("<h3>사용자가 결제를 취소했습니다.</h3>", status_code=200)
+async def payment_cancel(merchant_uid: str):
+    return Response(content=PAYMENT_CANCEL_HTML, media_type=HTML_MEDIA_TYPE)
 
 @router.get("/fail", response_class=HTMLResponse)
-def payment_fail(merchant_uid: str):
-    return HTMLResponse("<h3>결제에 실패했습니다.</h3>", status_code=200)
+async def payment_fail(merchant_uid: str):
+    return Response(content=PAYMENT_FAIL_HTML, media_type=HTML_MEDIA_TYPE)
@@ -1,45 +1,94 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-import httpx, json, os
+from fastapi import APIRouter, Depends, HTTPException, Request
+from cachetools import TTLCache
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+import httpx
+import json, os
 
 from payment.naver_pay import API_BASE, naver_auth_headers
 from app.auth import require_employee   # 있으면 사용
-from app.models.database import get_db, JobApplication
+from app.models.database import get_async_db, JobApplication
 
 router = APIRouter()
 
+REFUND_PENDING_MESSAGE = "근무완료 처리되었습니다. (환불 대기/관리자 재시도 필요)"
+
+# 환불 API 호출 중인 신청 (동시에 들어온 재시도가 같은 보증금을 중복 환불하지 않도록 차단)
+REFUND_IN_FLIGHT_TTL_SECONDS = 300
+refunding_applications = TTLCache(maxsize=10000, ttl=REFUND_IN_FLIGHT_TTL_SECONDS)
+
 @router.post("/api/work-complete/{application_id}")
-async def work_complete(application_id: int, user=Depends(require_employee), db: Session = Depends(get_db)):
-    app_row = db.query(JobApplication).filter(
-        JobApplication.id == application_id,
-        JobApplication.user_id == user.id
-    ).first()
+async def work_complete(application_id: int, request: Request, user=Depends(require_employee), db: AsyncSession = Depends(get_async_db)):
+    # 1) 근무 완료: 아직 완료되지 않았거나, 완료됐지만 환불이 끝나지 않은 신청을
+    #    UPDATE ... RETURNING으로 잡고 바로 커밋 (외부 환불 API 호출 동안 쓰기 잠금을 잡고 있지 않음)
+    app_row = (await db.execute(
+        update(JobApplication)
+        .where(
+            JobApplication.id == application_id,
+            JobApplication.user_id == user.id,
+            or_(
+                JobApplication.status != "completed",
+                and_(JobApplication.deposit_paid == True, JobApplication.deposit_refunded == False)
+            )
+        )
+        .values(status="completed")
+        .returning(
+            JobApplication.payment_id,
+            JobApplication.deposit_amount,
+            JobApplication.deposit_paid,
+            JobApplication.deposit_refunded
+        )
+    )).first()
+    await db.commit()
     if not app_row:
-        raise HTTPException(404, "Application not found")
-
-    # 1) 근무 완료
-    app_row.status = "completed"
-
-    # 2) 환불
-    if app_row.deposit_paid and not app_row.deposit_refunded:
-        payload = {
-            "merchantId": os.getenv("NAVER_PAY_MERCHANT_ID", ""),
-            "merchantUid": app_row.payment_id,  # 승인 때와 동일 UID
-            "cancelAmount": app_row.deposit_amount or 5000,
-            "cancelReason": "근무 완료 환불"
-        }
-        headers = naver_auth_headers(json.dumps(payload, ensure_ascii=False))
-        async with httpx.AsyncClient(timeout=15) as client:
-            r = await client.post(f"{API_BASE}/v1/payments/cancel", headers=headers, json=payload)
+        # 잡히지 않았으면 없는 신청이거나 이미 완료·환불(또는 미결제)된 신청
+        deposit_refunded = await db.scalar(
+            select(JobApplication.deposit_refunded)
+            .where(JobApplication.id == application_id, JobApplication.user_id == user.id)
+        )
+        if deposit_refunded is None:
+            raise HTTPException(404, "Application not found")
+        return {"message": "근무가 완료되었습니다.", "refund_ok": bool(deposit_refunded)}
+    refunded = bool(app_row.deposit_refunded)
+
+    # 2) 환불 (같은 신청의 환불이 이미 진행 중이면 다시 호출하지 않음)
+    if app_row.deposit_paid and not refunded:
+        if application_id in refunding_applications:
+            return {"message": REFUND_PENDING_MESSAGE, "refund_ok": False}
+        refunding_applications[application_id] = True
+
+        try:
+            payload = {
+                "merchantId": os.getenv("NAVER_PAY_MERCHANT_ID", ""),
+                "merchantUid": app_row.payment_id,  # 승인 때와 동일 UID
+                "cancelAmount": app_row.deposit_amount or 5000,
+                "cancelReason": "근무 완료 환불"
+            }
+            # 본문은 한 번만 직렬화하여 서명과 전송에 같은 바이트 사용
+            body = json.dumps(payload, ensure_ascii=False).encode()
+            headers = naver_auth_headers(body)
+            # 앱 시작 시 만든 공용 클라이언트로 keep-alive 연결 재사용
+            client = request.app.state.http_client
+            try:
+                r = await client.post(f"{API_BASE}/v1/payments/cancel", headers=headers, content=body)
+            except httpx.HTTPError as e:
+                # 연결 실패/시간 초과도 환불 대기로 남겨 재시도할 수 있게 함
+                return {"message": REFUND_PENDING_MESSAGE, "refund_ok": False, "pg": {"error": str(e)}}
             ok = r.status_code == 200
             data = r.json() if ok else {"code": r.status_code, "body": r.text}
 
-        if ok:
-            app_row.deposit_refunded = True
-        else:
-            db.commit()
-            return {"message": "근무완료 처리되었습니다. (환불 대기/관리자 재시도 필요)", "refund_ok": False, "pg": data}
+            if not ok:
+                return {"message": REFUND_PENDING_MESSAGE, "refund_ok": False, "pg": data}
+
+            # 3) 환불 완료 표시 (API 호출이 끝난 뒤 짧은 쓰기 트랜잭션으로 처리)
+            await db.execute(
+                update(JobApplication)
+                .where(JobApplication.id == application_id, JobApplication.deposit_refunded == False)
+                .values(deposit_refunded=True)
+            )
+            await db.commit()
+            refunded = True
+        finally:
+            refunding_applications.pop(application_id, None)
 
-    db.add(app_row)
-    db.commit()
-    return {"message": "근무가 완료되었습니다.", "refund_ok": bool(app_row.deposit_refunded)}
+    return {"message": "근무가 완료되었습니다.", "refund_ok": refunded}
@@ -0,0 +1,91 @@
+"""LocationService.process_location_batch 배치 처리/재처리 테스트
+
+실행: python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# app.models.database는 import 시 현재 디렉터리에 SQLite 파일을 만들므로
+# 저장소의 DB 파일을 건드리지 않도록 임시 디렉터리에서 import
+os.chdir(tempfile.mkdtemp())
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base, User, Employee, Site, Company, LocationEvent
+from app.services.location_service import LocationService
+
+
+class ProcessLocationBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.db = sessionmaker(bind=engine, autoflush=False)()
+
+        # 세션 커밋 횟수 기록
+        self.commits = 0
+
+        @event.listens_for(self.db, "after_commit")
+        def count_commit(session):
+            self.commits += 1
+
+        self.db.add(Company(id=1, name="c", business_number="1"))
+        self.db.add(Site(company_id=1, name="HQ", address="a", latitude=37.5, longitude=127.0, geofence_radius=100))
+        user = User(username="u", email="u@x", hashed_password="x", full_name="U")
+        self.db.add(user)
+        self.db.flush()
+        employee = Employee(user_id=user.id, employee_number="EMP0001", hire_date=datetime.now())
+        self.db.add(employee)
+        self.db.commit()
+        self.employee_id = employee.id
+        self.commits = 0
+
+    def tearDown(self):
+        self.db.close()
+
+    def _event_count(self):
+        return self.db.query(LocationEvent).filter(LocationEvent.employee_id == self.employee_id).count()
+
+    def test_batch_commits_once(self):
+        events = [
+            (self.employee_id, {"latitude": 37.5, "longitude": 127.0, "accuracy": 10}),
+            (self.employee_id, {"latitude": 37.6, "longitude": 127.1, "accuracy": 10}),
+        ]
+
+        results = LocationService.process_location_batch(events, self.db)
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual([r["event_type"] for r in results], ["geofence_enter", "geofence_exit"])
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(self._event_count(), 2)
+
+    def test_failing_event_is_replayed_individually(self):
+        events = [
+            (self.employee_id, {"latitude": 37.5, "longitude": 127.0, "accuracy": 10}),
+            (self.employee_id, {"accuracy": 10}),  # 위도/경도 누락 → 처리 중 KeyError
+            (self.employee_id, {"latitude": 37.6, "longitude": 127.1, "accuracy": 10}),
+        ]
+
+        results = LocationService.process_location_batch(events, self.db)
+
+        # 실패한 이벤트 자리에만 예외가 들어가고 나머지는 결과 반환
+        self.assertEqual(len(results), 3)
+        self.assertIsInstance(results[0], dict)
+        self.assertIsInstance(results[1], KeyError)
+        self.assertIsInstance(results[2], dict)
+        self.assertEqual([results[0]["event_type"], results[2]["event_type"]], ["geofence_enter", "geofence_exit"])
+
+        # 배치 롤백 후 성공한 이벤트만 한 건씩 다시 처리되어 저장됨
+        self.assertEqual(self._event_count(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()